@@ -20,6 +20,7 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
 
 # imports
+from array import array
 from math import floor
 
 try:
@@ -52,42 +53,36 @@ class CRGB:
           c = CRGB(255, 0, 0)
           c = CRGB(1.0, 0.0, 0.0)
           c = CRGB(CHSV(0.0, 1.0, 1.0))
+
+    Internal hot paths that already have in-range normalized values use
+    `from_normalized` instead, which skips the type checks and clamping.
     """
 
+    __slots__ = ("red", "green", "blue")
+
     def __init__(self, red: CHSV, green: float = 0.0, blue: float = 0.0) -> None:
         if isinstance(red, CHSV):
             # If first/only argument is a CHSV type, perform HSV to RGB
             # conversion.
-            hsv: CHSV = red  # 'red' is CHSV, this is just more readable
-            hue: float = hsv.hue * 6.0  # Hue circle = 0.0 to 6.0
-            sxt: int = floor(hue)  # Sextant index is next-lower integer of hue
-            frac: float = hue - sxt  # Fraction-within-sextant is 0.0 to <1.0
-            sxt: int = int(sxt) % 6  # mod6 the sextant so it's always 0 to 5
-
-            if sxt == 0:  # Red to <yellow
-                r, g, b = 1.0, frac, 0.0
-            elif sxt == 1:  # Yellow to <green
-                r, g, b = 1.0 - frac, 1.0, 0.0
-            elif sxt == 2:  # Green to <cyan
-                r, g, b = 0.0, 1.0, frac
-            elif sxt == 3:  # Cyan to <blue
-                r, g, b = 0.0, 1.0 - frac, 1.0
-            elif sxt == 4:  # Blue to <magenta
-                r, g, b = frac, 0.0, 1.0
-            else:  # Magenta to <red
-                r, g, b = 1.0, 0.0, 1.0 - frac
-
-            invsat: float = 1.0 - hsv.saturation  # Inverse-of-saturation
-
-            self.red = ((r * hsv.saturation) + invsat) * hsv.value
-            self.green = ((g * hsv.saturation) + invsat) * hsv.value
-            self.blue = ((b * hsv.saturation) + invsat) * hsv.value
+            self.red, self.green, self.blue = _hsv_to_rgb(red.hue, red.saturation, red.value)
         else:
             # Red, green, blue arguments (normalized floats OR integers)
             self.red = clamp_norm(red)
             self.green = clamp_norm(green)
             self.blue = clamp_norm(blue)
 
+    @classmethod
+    def from_normalized(cls, red: float, green: float, blue: float) -> CRGB:
+        """Trusted constructor for red, green, blue floats ALREADY in the
+        0.0 to 1.0 range. No type dispatch or clamping is performed, so
+        passing anything else yields a color that may not pack correctly.
+        """
+        color = object.__new__(cls)
+        color.red = red
+        color.green = green
+        color.blue = blue
+        return color
+
     def __repr__(self) -> tuple[int, int, int]:
         return (self.red, self.green, self.blue)
 
@@ -187,6 +182,8 @@ class CHSV:
     HSV->RGB->HSV translations won't have the same input and output.
     """
 
+    __slots__ = ("hue", "saturation", "value")
+
     def __init__(self, h: float, s: float = 1.0, v: float = 1.0) -> None:
         if isinstance(h, float):
             self.hue: float = h  # Don't clamp! Hue can wrap around forever.
@@ -195,6 +192,18 @@ class CHSV:
         self.saturation: float = clamp_norm(s)
         self.value: float = clamp_norm(v)
 
+    @classmethod
+    def from_normalized(cls, h: float, s: float, v: float) -> CHSV:
+        """Trusted constructor for float hue (any range) and saturation and
+        value floats ALREADY in the 0.0 to 1.0 range. No type dispatch or
+        clamping is performed.
+        """
+        color = object.__new__(cls)
+        color.hue = h
+        color.saturation = s
+        color.value = v
+        return color
+
     def __repr__(
         self,
     ) -> tuple[float, float, float]:
@@ -232,8 +241,382 @@ class CHSV:
         :rtype: integer or 4-tuple.
         """
 
-        # Convert CHSV to CRGB, return packed result
-        return CRGB(self).pack(white)
+        if white:
+            # Convert CHSV to CRGB, return packed result
+            return CRGB(self).pack(white)
+        # Plain 24-bit result doesn't need the intermediate CRGB
+        return _pack_rgb(*_hsv_to_rgb(self.hue, self.saturation, self.value))
+
+
+class PixelFrame:
+    """Fixed-length frame of RGB colors kept in contiguous storage.
+
+    A lighter alternative to a list of `CRGB` objects for frame buffers.
+    Colors are stored as normalized floats (single precision) in one
+    ``array('f')``, three entries per pixel in R,G,B order, so whole-frame
+    operations (`fill`, `gamma_adjust`, `mix`, `pack`) run without creating
+    a Python object per pixel.
+
+    Pixels can be assigned a `CRGB`, `CHSV` or packed integer, and are
+    read back as `CRGB`:
+
+    .. code-block:: python
+
+          frame = PixelFrame(300)
+          frame.fill(CHSV(0.5))
+          frame[0] = 0xFF0000
+          frame.gamma_adjust(brightness=0.25)
+          pixels[:] = frame.pack()
+
+    With 'track_dirty' set, the frame also remembers which pixels were
+    assigned since the last `clear_dirty`, so effects that only change a
+    few pixels per frame can gamma-correct and pack just those (the
+    'dirty_only' arguments to `gamma_adjust`, `pack` and `pack_into`), and
+    a driver can push just the changed `dirty_spans`. Whole-frame
+    operations mark every pixel dirty. Writes made directly to `rgb`
+    aren't seen; follow them with `mark_dirty`.
+
+    With 'track_power' set, the frame keeps running per-channel totals of
+    its 8-bit levels (see `channel_totals`) up to date as pixels are
+    assigned, so an `adafruit_fancyled.power.PowerBudget` can estimate the
+    strip's current draw
+    without a pass over the frame. Whole-frame operations (other than
+    `fill`) and `mark_dirty` make the totals recount on next use.
+
+    .. code-block:: python
+
+          frame = PixelFrame(300, track_dirty=True)
+          frame[sparkle] = 0xFFFFFF
+          frame.gamma_adjust(dirty_only=True)
+          pack_into(frame, buf, "GRB", dirty_only=True)
+          for start, stop in frame.dirty_spans():
+              ...  # Send bytes start*3 to stop*3 of buf
+          frame.clear_dirty()
+
+    :param int length: number of pixels in the frame.
+    :param color: optional initial `CRGB`, `CHSV` or packed integer color
+      for every pixel (default is black).
+    :param bool track_dirty: keep track of changed pixels (default False;
+      without tracking, every pixel is always considered dirty).
+    :param bool track_power: keep running channel totals for power
+      estimates (default False; without tracking, `channel_totals` counts
+      the whole frame each time).
+    """
+
+    def __init__(
+        self,
+        length: int,
+        color: Optional[Union[CRGB, CHSV, int]] = None,
+        track_dirty: bool = False,
+        track_power: bool = False,
+    ) -> None:
+        # A bytearray initializer is copied as raw (zeroed) bytes, so this
+        # allocates the storage without building a temporary list of floats.
+        self.rgb = array("f", bytearray(12 * length))
+        # Dirty tracking: a flag per pixel plus a list of the flagged
+        # indices, so spans and clearing cost per changed pixel, not per
+        # pixel in the frame. _all_dirty short-circuits whole-frame changes.
+        self._dirty = bytearray(length) if track_dirty else None
+        self._dirty_indices = []
+        self._all_dirty = True
+        # Power tracking: running R,G,B totals of 8-bit levels, or None when
+        # they need a recount (always None if not tracking).
+        self._track_power = track_power
+        self._totals = [0, 0, 0] if track_power else None
+        if color is not None:
+            self.fill(color)
+
+    def __len__(self) -> int:
+        """Retrieve number of pixels in the frame."""
+        return len(self.rgb) // 3
+
+    def __getitem__(self, key: int) -> CRGB:
+        """Retrieve pixel as a `CRGB` color."""
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError
+        key *= 3
+        buf = self.rgb
+        return CRGB.from_normalized(buf[key], buf[key + 1], buf[key + 2])
+
+    def __setitem__(self, key: int, color: Union[CRGB, CHSV, int]) -> None:
+        """Assign pixel from a `CRGB`, `CHSV` or packed integer color."""
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError
+        dirty = self._dirty
+        if dirty is not None and not dirty[key]:
+            dirty[key] = 1
+            self._dirty_indices.append(key)
+        buf = self.rgb
+        key *= 3
+        totals = self._totals
+        if totals is None:
+            buf[key], buf[key + 1], buf[key + 2] = _to_rgb(color)
+            return
+        # Take out the old levels and add the new ones, as stored (float32)
+        totals[0] -= _level8(buf[key])
+        totals[1] -= _level8(buf[key + 1])
+        totals[2] -= _level8(buf[key + 2])
+        buf[key], buf[key + 1], buf[key + 2] = _to_rgb(color)
+        totals[0] += _level8(buf[key])
+        totals[1] += _level8(buf[key + 1])
+        totals[2] += _level8(buf[key + 2])
+
+    def mark_dirty(self, start: int = 0, stop: Optional[int] = None) -> None:
+        """Mark pixels 'start' to 'stop' (exclusive, default is the end of
+        the frame) as changed, e.g. after writing to `rgb` directly.
+        """
+        length = len(self)
+        if stop is None or stop > length:
+            stop = length
+        self._totals = None  # Pixels changed behind __setitem__'s back
+        if start <= 0 and stop == length:
+            self._all_dirty = True
+        elif self._dirty is not None:
+            dirty = self._dirty
+            for i in range(max(start, 0), stop):
+                if not dirty[i]:
+                    dirty[i] = 1
+                    self._dirty_indices.append(i)
+
+    def dirty_spans(self, max_gap: int = 0) -> list[tuple[int, int]]:
+        """Runs of pixels changed since the last `clear_dirty`, as a sorted
+        list of (start, stop) index pairs (stop is exclusive). The whole
+        frame is one span if it was changed as a whole, or if the frame
+        isn't tracking changes.
+
+        :param int max_gap: merge spans separated by up to this many
+          unchanged pixels (fewer, larger transfers for the driver).
+        """
+        if self._all_dirty or self._dirty is None:
+            return [(0, len(self))] if len(self) else []
+        spans = []
+        for i in sorted(self._dirty_indices):
+            if spans and i - spans[-1][1] <= max_gap:
+                spans[-1][1] = i + 1
+            else:
+                spans.append([i, i + 1])
+        return [(start, stop) for start, stop in spans]
+
+    def clear_dirty(self) -> None:
+        """Forget changes so far (e.g. once they're written to the strip)."""
+        dirty = self._dirty
+        if dirty is None:
+            return
+        if self._all_dirty:
+            self._dirty = bytearray(len(dirty))
+        else:
+            for i in self._dirty_indices:
+                dirty[i] = 0
+        self._dirty_indices = []
+        self._all_dirty = False
+
+    def channel_totals(self) -> tuple[int, int, int]:
+        """Sums of every pixel's 8-bit red, green and blue levels (as
+        `pack` would encode them), e.g. for power estimates. With
+        'track_power', these are kept up to date as pixels are assigned;
+        otherwise (or after a whole-frame change) the frame is counted.
+        """
+        totals = self._totals
+        if totals is None:
+            buf = self.rgb
+            totals = [0, 0, 0]
+            for i in range(0, len(buf), 3):
+                totals[0] += _level8(buf[i])
+                totals[1] += _level8(buf[i + 1])
+                totals[2] += _level8(buf[i + 2])
+            if self._track_power:
+                self._totals = totals
+        return totals[0], totals[1], totals[2]
+
+    def fill(self, color: Union[CRGB, CHSV, int]) -> None:
+        """Set every pixel to the same `CRGB`, `CHSV` or packed integer color."""
+        red, green, blue = _to_rgb(color)  # Convert once, not per pixel
+        self._all_dirty = True
+        buf = self.rgb
+        for i in range(0, len(buf), 3):
+            buf[i] = red
+            buf[i + 1] = green
+            buf[i + 2] = blue
+        if self._track_power:
+            # Every pixel is the same, so the totals need no recount
+            length = len(self)
+            if length:
+                self._totals = [
+                    _level8(buf[0]) * length,
+                    _level8(buf[1]) * length,
+                    _level8(buf[2]) * length,
+                ]
+            else:
+                self._totals = [0, 0, 0]
+
+    def gamma_adjust(
+        self,
+        gamma_value: Optional[Union[float, tuple[float, float, float]]] = None,
+        brightness: Union[float, tuple[float, float, float]] = 1.0,
+        dirty_only: bool = False,
+    ) -> None:
+        """Gamma-correct the whole frame in-place. Gamma and brightness are
+        single values or (R,G,B) tuples, or a `GammaTable`, as with the
+        `gamma_adjust` function (default gamma is GFACTOR). If 'dirty_only'
+        is set, only pixels changed since the last `clear_dirty` are
+        corrected (and nothing is marked dirty); otherwise every pixel is
+        corrected and marked dirty.
+        """
+        table = _gamma_table(gamma_value, brightness)
+        self._totals = None
+        if dirty_only:
+            for start, stop in self.dirty_spans():
+                table.apply(self.rgb, start, stop)
+        else:
+            table.apply(self.rgb)
+            self._all_dirty = True
+
+    def mix(self, other: Union[PixelFrame, CRGB, CHSV, int], weight2: float = 0.5) -> None:
+        """Blend the frame in-place toward another same-length `PixelFrame`
+        (pixel by pixel) or toward a single `CRGB`, `CHSV` or packed integer
+        color, using weighting (0.0 to 1.0) of the second color.
+        """
+        weight2 = clamp(weight2, 0.0, 1.0)
+        weight1 = 1.0 - weight2
+        buf = self.rgb
+        self._all_dirty = True
+        self._totals = None
+        if isinstance(other, PixelFrame):
+            src = other.rgb
+            if len(src) != len(buf):
+                raise ValueError("PixelFrame lengths differ")
+            for i in range(len(buf)):
+                buf[i] = buf[i] * weight1 + src[i] * weight2
+            return
+        red, green, blue = _to_rgb(other)
+        red *= weight2
+        green *= weight2
+        blue *= weight2
+        for i in range(0, len(buf), 3):
+            buf[i] = buf[i] * weight1 + red
+            buf[i + 1] = buf[i + 1] * weight1 + green
+            buf[i + 2] = buf[i + 2] * weight1 + blue
+
+    def pack(self, out: Optional[Any] = None, dirty_only: bool = False) -> Any:
+        """'Pack' every pixel into a 24-bit RGB integer a la ``0x00RRGGBB``.
+
+        :param out: optional mutable sequence (list, ``array('I')``, NeoPixel
+          object...) at least as long as the frame, to receive the packed
+          values. If omitted, a new ``array('I')`` is allocated.
+        :param bool dirty_only: only pack pixels changed since the last
+          `clear_dirty`, leaving the rest of 'out' as it was.
+        :returns: ``out``, or the newly-allocated array.
+        """
+        length = len(self)
+        if out is None:
+            out = array("I", bytearray(4 * length))
+        buf = self.rgb
+        for start, stop in self.dirty_spans() if dirty_only else ((0, length),):
+            for i in range(start, stop):
+                j = i * 3
+                # Same bucketing as denormalize(); stored values never go
+                # negative, so only the top end (1.0 -> 256) needs clipping.
+                red = int(buf[j] * 256.0)
+                green = int(buf[j + 1] * 256.0)
+                blue = int(buf[j + 2] * 256.0)
+                out[i] = (
+                    ((255 if red > 255 else red) << 16)
+                    | ((255 if green > 255 else green) << 8)
+                    | (255 if blue > 255 else blue)
+                )
+        return out
+
+
+def _to_rgb(color: Union[CRGB, CHSV, int]) -> tuple[float, float, float]:
+    """Normalized (R,G,B) tuple from a `CRGB`, `CHSV` or packed integer."""
+    if isinstance(color, int):
+        # Same math as unpack(), minus the CRGB instance.
+        return (
+            (color & 0xFF0000) / 16711680.0,
+            (color & 0x00FF00) / 65280.0,
+            (color & 0x0000FF) / 255.0,
+        )
+    if isinstance(color, CHSV):
+        return _hsv_to_rgb(color.hue, color.saturation, color.value)
+    return color.red, color.green, color.blue
+
+
+def _byte_values(data: Any, signed: bool = False) -> Optional[Any]:
+    """'data' as a flat sequence of 8-bit integers, if it holds them:
+    bytes, bytearray, ``array('B')``, or a buffer such as a byte memoryview
+    or uint8 NumPy array (any shape). Signed 8-bit data is accepted only
+    if 'signed' is set. Returns None for anything else (lists, float
+    arrays...).
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    if isinstance(data, array):
+        return data if data.typecode == "B" or (signed and data.typecode == "b") else None
+    if isinstance(data, (list, tuple)):
+        return None
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    # CircuitPython's memoryview has no format; treat it as bytes-like
+    fmt = getattr(view, "format", "B")
+    if fmt != "B" and not (signed and fmt == "b"):
+        return None
+    if getattr(view, "ndim", 1) != 1:
+        view = view.cast(fmt)  # Flatten, e.g. a 2D noise field
+    return view
+
+
+def _level8(value: float) -> int:
+    """Normalized level to 8 bits, with the same bucketing as denormalize()."""
+    level = int(value * 256.0)
+    return 0 if level < 0 else 255 if level > 255 else level
+
+
+def _hsv_to_rgb(hue: float, saturation: float, value: float) -> tuple[float, float, float]:
+    """Convert normalized hue, saturation, value to a normalized (R,G,B) tuple."""
+    hue: float = hue * 6.0  # Hue circle = 0.0 to 6.0
+    sxt: int = floor(hue)  # Sextant index is next-lower integer of hue
+    frac: float = hue - sxt  # Fraction-within-sextant is 0.0 to <1.0
+    sxt: int = int(sxt) % 6  # mod6 the sextant so it's always 0 to 5
+
+    if sxt == 0:  # Red to <yellow
+        r, g, b = 1.0, frac, 0.0
+    elif sxt == 1:  # Yellow to <green
+        r, g, b = 1.0 - frac, 1.0, 0.0
+    elif sxt == 2:  # Green to <cyan
+        r, g, b = 0.0, 1.0, frac
+    elif sxt == 3:  # Cyan to <blue
+        r, g, b = 0.0, 1.0 - frac, 1.0
+    elif sxt == 4:  # Blue to <magenta
+        r, g, b = frac, 0.0, 1.0
+    else:  # Magenta to <red
+        r, g, b = 1.0, 0.0, 1.0 - frac
+
+    invsat: float = 1.0 - saturation  # Inverse-of-saturation
+
+    return (
+        ((r * saturation) + invsat) * value,
+        ((g * saturation) + invsat) * value,
+        ((b * saturation) + invsat) * value,
+    )
+
+
+def _expand_rgb(
+    value: Optional[Union[float, tuple[float, float, float]]], default: float
+) -> tuple[float, float, float]:
+    """Expand a single factor (or None for default) or (R,G,B) sequence
+    into a 3-tuple of per-channel factors.
+    """
+    if value is None:
+        value = default
+    if isinstance(value, (int, float)):
+        return value, value, value
+    return value[0], value[1], value[2]
 
 
 def clamp(
@@ -312,6 +695,60 @@ def denormalize(
     return [denormalize(n) for n in val]
 
 
+# normalize() of each 8-bit level, built on first use of normalize_many()
+_normalized = []
+
+
+def normalize_many(data: Any, out: Optional[Any] = None) -> Any:
+    """Convert a whole buffer of 8-bit (0 to 255) values to normalized
+    (0.0 to 1.0) floats in one pass, with the same results as normalize()
+    on each (through a 256-entry lookup table, not a call per value).
+
+    :param data: unsigned 8-bit data (bytes, bytearray, ``array('B')``, a
+      byte memoryview...) or any other sequence of integers, including
+      wider or signed buffers (these are clamped to 0 to 255).
+    :param out: optional mutable sequence (``array('f')``, list,
+      `PixelFrame.rgb`...) at least as long as 'data', to receive the
+      floats. If omitted, a new ``array('f')`` is allocated.
+    :returns: 'out', or the newly-allocated array.
+    """
+    table = _normalized
+    if not table:
+        table.extend(i / 255.0 for i in range(256))
+    values = _byte_values(data)
+    if out is None:
+        out = array("f", bytearray(4 * len(data if values is None else values)))
+    if values is not None:
+        # Unsigned 8-bit values index the table directly, no clamping
+        for i, value in enumerate(values):
+            out[i] = table[value]
+    else:
+        for i, value in enumerate(data):
+            out[i] = table[0 if value < 0 else 255 if value > 255 else value]
+    return out
+
+
+def denormalize_many(data: Any, out: Optional[Any] = None) -> Any:
+    """Convert a whole sequence of normalized (0.0 to 1.0) floats to 8-bit
+    (0 to 255) values in one pass, with the same results as denormalize()
+    on each.
+
+    :param data: ``array('f')``, `PixelFrame.rgb`, list or other sequence
+      of floats.
+    :param out: optional bytearray, memoryview or other mutable sequence
+      at least as long as 'data', to receive the values. If omitted, a new
+      bytearray is allocated.
+    :returns: 'out', or the newly-allocated bytearray.
+    """
+    if out is None:
+        out = bytearray(len(data))
+    for i, value in enumerate(data):
+        # Same bucketing as denormalize(), inline
+        level = int(value * 256.0)
+        out[i] = 0 if level < 0 else 255 if level > 255 else level
+    return out
+
+
 def unpack(val: int) -> CRGB:
     """'Unpack' a 24-bit color into a `CRGB` instance.
 
@@ -323,7 +760,7 @@ def unpack(val: int) -> CRGB:
     # See notes in normalize() for math explanation.  Large constants here
     # avoid the usual shift-right step, e.g. 16711680.0 is 255 * 256 * 256,
     # so we can just mask out the red and divide by this for 0.0 to 1.0.
-    return CRGB(
+    return CRGB.from_normalized(
         (val & 0xFF0000) / 16711680.0,  # Red
         (val & 0x00FF00) / 65280.0,  # Green
         (val & 0x0000FF) / 255.0,
@@ -338,7 +775,7 @@ def mix(color1: Union[CRGB, CHSV], color2: Union[CRGB, CHSV], weight2: float = 0
     :returns: `CRGB` color in most cases, `CHSV` if both inputs are `CHSV`.
     """
 
-    clamp(weight2, 0.0, 1.0)
+    weight2 = clamp(weight2, 0.0, 1.0)
     weight1: float = 1.0 - weight2
 
     if isinstance(color1, CHSV):
@@ -351,7 +788,7 @@ def mix(color1: Union[CRGB, CHSV], color2: Union[CRGB, CHSV], weight2: float = 0
             hue = color1.hue + ((color2.hue - color1.hue) * weight2)
             sat = color1.saturation * weight1 + color2.saturation * weight2
             val = color1.value * weight1 + color2.value * weight2
-            return CHSV(hue, sat, val)
+            return CHSV.from_normalized(hue, sat, val)
         # Else color1 is HSV, color2 is RGB.  Convert color1 to RGB
         # before doing interpolation in RGB space.
         color1 = CRGB(color1)
@@ -370,8 +807,9 @@ def mix(color1: Union[CRGB, CHSV], color2: Union[CRGB, CHSV], weight2: float = 0
         if isinstance(color1, int):
             color1 = unpack(color1)
 
-    # Interpolate and return as CRGB type
-    return CRGB(
+    # Interpolate and return as CRGB type. Both inputs and the weight are
+    # in range, so the result is too and needs no re-clamping.
+    return CRGB.from_normalized(
         (color1.red * weight1 + color2.red * weight2),
         (color1.green * weight1 + color2.green * weight2),
         (color1.blue * weight1 + color2.blue * weight2),
@@ -379,9 +817,173 @@ def mix(color1: Union[CRGB, CHSV], color2: Union[CRGB, CHSV], weight2: float = 0
 
 
 GFACTOR = 2.7  # Default gamma-correction factor for function below
+GAMMA_CACHE_SIZE = 8  # Max number of tables kept by GammaTable.get()
+
+_gamma_cache = {}  # GammaTable instances by (gamma, brightness, size) key
+_gamma_cache_keys = []  # Cache keys, least- to most-recently used
+
+
+class GammaTable:
+    """Precomputed gamma-correction and brightness curves for R, G and B.
+
+    Replaces the three pow() calls per color in gamma correction with
+    linearly-interpolated table lookups. With 256 steps, results stay
+    within about 1e-5 of pow() for the usual gamma of 2.0 to 3.0, and 1e-4
+    from 1.0 to 2.0 -- well under one 8-bit step. This is much cheaper on
+    boards without floating-point hardware. Build once and reuse across
+    frames, or use `GammaTable.get` to share cached tables -- `gamma_adjust`
+    does this automatically for `CRGB` and `CHSV` colors.
+
+    Curves for gamma below 1.0 are too steep near zero to interpolate
+    accurately (and undefined at zero for gamma of 0 or less), so a table
+    with any such gamma has no curves (``exact`` is True, and ``red``,
+    ``green`` and ``blue`` are None) and calls pow() instead, as
+    `gamma_adjust` always did.
+
+    :param gamma_value: single gamma-adjustment factor (float usu. > 1.0)
+      or (R,G,B) tuple, default if unspecified is GFACTOR.
+    :param brightness: single brightness (0.0 to 1.0) or (R,G,B) tuple.
+    :param int size: number of table steps, e.g. 256 (default), 1024 or 4096.
+    """
+
+    def __init__(
+        self,
+        gamma_value: Optional[Union[float, tuple[float, float, float]]] = None,
+        brightness: Union[float, tuple[float, float, float]] = 1.0,
+        size: int = 256,
+    ) -> None:
+        self.gamma = _expand_rgb(gamma_value, GFACTOR)
+        self.brightness = _expand_rgb(brightness, 1.0)
+        self.size = size
+        self.exact = min(self.gamma) < 1.0
+        if self.exact:
+            self.red = self.green = self.blue = None
+        else:
+            # Channels with identical settings share one curve. Each curve
+            # has size + 1 entries so that a level of exactly 1.0 has its
+            # own entry.
+            curves = {}
+            for key in zip(self.gamma, self.brightness):
+                if key not in curves:
+                    gamma, level = key
+                    curves[key] = array(
+                        "f", [pow(i / size, gamma) * level for i in range(size + 1)]
+                    )
+            self.red = curves[(self.gamma[0], self.brightness[0])]
+            self.green = curves[(self.gamma[1], self.brightness[1])]
+            self.blue = curves[(self.gamma[2], self.brightness[2])]
+        # Gamma of 0 or more keeps 0.0 to 1.0 levels in that range, and 0.0
+        # to 1.0 brightness does too, so results can skip the clamping
+        # constructor.
+        self._trusted = (
+            min(self.gamma) >= 0.0 and 0.0 <= min(self.brightness) and max(self.brightness) <= 1.0
+        )
+        self._lut = None
+
+    @classmethod
+    def get(
+        cls,
+        gamma_value: Optional[Union[float, tuple[float, float, float]]] = None,
+        brightness: Union[float, tuple[float, float, float]] = 1.0,
+        size: int = 256,
+    ) -> GammaTable:
+        """Fetch a `GammaTable` for these settings from the cache, building
+        it on first use. The cache holds up to GAMMA_CACHE_SIZE tables; the
+        least-recently used one is evicted to make room for a new one.
+        """
+        key = (_expand_rgb(gamma_value, GFACTOR), _expand_rgb(brightness, 1.0), size)
+        table = _gamma_cache.get(key)
+        if table is None:
+            table = cls(key[0], key[1], size)
+            if len(_gamma_cache_keys) >= GAMMA_CACHE_SIZE:
+                del _gamma_cache[_gamma_cache_keys.pop(0)]
+            _gamma_cache[key] = table
+        else:
+            _gamma_cache_keys.remove(key)
+        _gamma_cache_keys.append(key)
+        return table
+
+    @property
+    def lut(self) -> bytearray:
+        """8-bit results for 8-bit inputs, for integer-only lookups: 768
+        bytes, 256 for red (inputs 0 to 255), then green, then blue. Same
+        results as the float path (interpolation, then denormalize()).
+        Built on first use.
+        """
+        if self._lut is None:
+            lut = bytearray(768)
+            for i in range(256):
+                value = i / 255.0
+                for channel, level in enumerate(self.levels(value, value, value)):
+                    byte = int(level * 256.0)
+                    lut[channel * 256 + i] = 0 if byte < 0 else 255 if byte > 255 else byte
+            self._lut = lut
+        return self._lut
+
+    def levels(self, red: float, green: float, blue: float) -> tuple[float, float, float]:
+        """Gamma-corrected (R,G,B) levels for normalized R,G,B levels (not
+        clamped).
+        """
+        if self.exact:
+            gamma = self.gamma
+            brightness = self.brightness
+            return (
+                pow(red, gamma[0]) * brightness[0],
+                pow(green, gamma[1]) * brightness[1],
+                pow(blue, gamma[2]) * brightness[2],
+            )
+        size = self.size
+        return (
+            _interpolate(self.red, red * size),
+            _interpolate(self.green, green * size),
+            _interpolate(self.blue, blue * size),
+        )
 
+    def adjust(self, color: Union[CRGB, CHSV, int]) -> CRGB:
+        """Gamma-correct a single `CRGB`, `CHSV` or packed integer color.
 
-def gamma_adjust(  # noqa: PLR0912, too-many-branches
+        :returns: gamma-corrected `CRGB` color.
+        """
+        make = CRGB.from_normalized if self._trusted else CRGB
+        return make(*self.levels(*_to_rgb(color)))
+
+    def apply(self, buf: Any, start: int = 0, stop: Optional[int] = None) -> None:
+        """Gamma-correct a sequence of normalized levels in-place, three per
+        pixel in R,G,B order (e.g. `PixelFrame.rgb`), optionally only
+        pixels 'start' to 'stop' (exclusive).
+        """
+        end = len(buf) if stop is None else stop * 3
+        if self.exact:
+            for channel in range(3):
+                gamma = self.gamma[channel]
+                level = self.brightness[channel]
+                for i in range(start * 3 + channel, end, 3):
+                    buf[i] = pow(buf[i], gamma) * level
+            return
+        size = self.size
+        top = float(size)
+        for channel, curve in enumerate((self.red, self.green, self.blue)):
+            last = curve[size]
+            for i in range(start * 3 + channel, end, 3):
+                pos = buf[i] * size
+                if pos >= top:
+                    buf[i] = last
+                else:
+                    idx = int(pos)
+                    low = curve[idx]
+                    buf[i] = low + (curve[idx + 1] - low) * (pos - idx)
+
+
+def _interpolate(curve: Any, pos: float) -> float:
+    """Linearly-interpolated value at fractional index 'pos' of a curve."""
+    idx = int(pos)
+    if idx >= len(curve) - 1:
+        return curve[-1]
+    low = curve[idx]
+    return low + (curve[idx + 1] - low) * (pos - idx)
+
+
+def gamma_adjust(
     val: Any,
     gamma_value: Any = None,
     brightness: Optional[Union[float, tuple[int, int, int]]] = 1.0,
@@ -413,6 +1015,11 @@ def gamma_adjust(  # noqa: PLR0912, too-many-branches
 
     In cases 2 and 3, there is NO return value if 'inplace' is True --
     the original values are modified.
+
+    For `CRGB` and `CHSV` colors, gamma and brightness are applied through
+    a cached `GammaTable` (see `GammaTable.get`), or a `GammaTable` or
+    `adafruit_fancyled.transform.ChannelTransform` can be passed directly
+    as 'gamma_value' (brightness is then ignored).
     """
 
     if isinstance(val, float):
@@ -435,91 +1042,30 @@ def gamma_adjust(  # noqa: PLR0912, too-many-branches
             for x in val:
                 newlist.append(pow(x, gamma_value) * brightness)
             return newlist
-        # List of CRGB or CHSV...we'll get back to that in a moment...
-        # but first determine gamma-correction factors for R,G,B:
-        if gamma_value is None:
-            # No gamma specified, use default
-            gamma_red, gamma_green, gamma_blue = GFACTOR, GFACTOR, GFACTOR
-        elif isinstance(gamma_value, float):
-            # Single gamma value provided, apply to R,G,B
-            gamma_red, gamma_green, gamma_blue = (gamma_value, gamma_value, gamma_value)
-        else:
-            gamma_red, gamma_green, gamma_blue = (
-                gamma_value[0],
-                gamma_value[1],
-                gamma_value[2],
-            )
-        if isinstance(brightness, float):
-            # Single brightness value provided, apply to R,G,B
-            brightness_red, brightness_green, brightness_blue = (
-                brightness,
-                brightness,
-                brightness,
-            )
-        else:
-            brightness_red, brightness_green, brightness_blue = (
-                brightness[0],
-                brightness[1],
-                brightness[2],
-            )
+        # List of CRGB or CHSV, adjusted through the table for these
+        # R,G,B gamma-correction and brightness factors.
+        adjust = _gamma_table(gamma_value, brightness).adjust
         if inplace:
             for i, x in enumerate(val):
-                if isinstance(x, CHSV):
-                    x = CRGB(x)  # noqa: PLW2901 loop variable overwritten
-                val[i] = CRGB(
-                    pow(x.red, gamma_red) * brightness_red,
-                    pow(x.green, gamma_green) * brightness_green,
-                    pow(x.blue, gamma_blue) * brightness_blue,
-                )
+                val[i] = adjust(x)
             return None
-        newlist = []
-        for x in val:
-            if isinstance(x, CHSV):
-                x = CRGB(x)  # noqa: PLW2901 loop variable overwritten
-            newlist.append(
-                CRGB(
-                    pow(x.red, gamma_red) * brightness_red,
-                    pow(x.green, gamma_green) * brightness_green,
-                    pow(x.blue, gamma_blue) * brightness_blue,
-                )
-            )
-        return newlist
+        return [adjust(x) for x in val]
 
     # Single CRGB or CHSV value
-    if gamma_value is None:
-        # No gamma specified, use default
-        gamma_red, gamma_green, gamma_blue = GFACTOR, GFACTOR, GFACTOR
-    elif isinstance(gamma_value, float):
-        # Single gamma value provided, apply to R,G,B
-        gamma_red, gamma_green, gamma_blue = (gamma_value, gamma_value, gamma_value)
-    else:
-        gamma_red, gamma_green, gamma_blue = (
-            gamma_value[0],
-            gamma_value[1],
-            gamma_value[2],
-        )
-    if isinstance(brightness, float):
-        # Single brightness value provided, apply to R,G,B
-        brightness_red, brightness_green, brightness_blue = (
-            brightness,
-            brightness,
-            brightness,
-        )
-    else:
-        brightness_red, brightness_green, brightness_blue = (
-            brightness[0],
-            brightness[1],
-            brightness[2],
-        )
+    return _gamma_table(gamma_value, brightness).adjust(val)
 
-    if isinstance(val, CHSV):
-        val = CRGB(val)
 
-    return CRGB(
-        pow(val.red, gamma_red) * brightness_red,
-        pow(val.green, gamma_green) * brightness_green,
-        pow(val.blue, gamma_blue) * brightness_blue,
-    )
+def _gamma_table(gamma_value: Any, brightness: Any) -> GammaTable:
+    """GammaTable passed in as 'gamma_value' (or the 'table' of a
+    transform.ChannelTransform), or the cached table for the given gamma
+    and brightness settings.
+    """
+    if isinstance(gamma_value, GammaTable):
+        return gamma_value
+    table = getattr(gamma_value, "table", None)
+    if isinstance(table, GammaTable):
+        return table
+    return GammaTable.get(gamma_value, brightness)
 
 
 def palette_lookup(
@@ -546,56 +1092,652 @@ def palette_lookup(
     return mix(color1, color2, weight2)
 
 
+class Palette:
+    """Color palette compiled once for fast repeated lookups.
+
+    Entries may be `CRGB`, `CHSV` and/or packed integers, as with
+    `palette_lookup`, but are all converted to RGB up front, so lookups
+    don't repeat any type dispatch or color conversion. (Consequently,
+    even a palette of only `CHSV` colors is interpolated in RGB space.)
+
+    Optionally, a table of 'steps' interpolated colors (e.g. 256 or 1024)
+    can be precomputed, so that lookups are a single indexing operation;
+    positions are then quantized to the nearest-lower table step.
+
+    .. code-block:: python
+
+          palette = Palette([CRGB(255, 0, 0), CHSV(0.5), 0x0000FF], steps=256)
+          pixels[i] = palette.lookup(offset + i / num_leds)
+
+    :param palette: color palette (list of CRGB, CHSV and/or packed integers)
+    :param int steps: number of precomputed table entries, or None (default)
+      to interpolate on every lookup.
+    """
+
+    def __init__(
+        self, palette: Union[list[CRGB], list[CHSV], list[int]], steps: Optional[int] = None
+    ) -> None:
+        self._length = len(palette)
+        rgb = []
+        for color in palette:
+            rgb.extend(_to_rgb(color))
+        rgb.extend(rgb[0:3])  # Repeat first color at end, for wraparound
+        self._rgb = rgb
+        self._build_table(steps)
+
+    def _build_table(self, steps: Optional[int]) -> None:
+        """Precompute 'steps' packed colors (if steps is set) from sample()."""
+        self.steps = steps
+        self.table = None
+        if steps:
+            table = array("I", bytearray(4 * steps))
+            for i in range(steps):
+                table[i] = _pack_rgb(*self.sample(i / steps))
+            self.table = table
+
+    def __len__(self) -> int:
+        """Retrieve number of colors in the palette."""
+        return self._length
+
+    def sample(self, position: float) -> tuple[float, float, float]:
+        """Interpolated color at palette position (0.0 to 1.0, wraps around),
+        same as `palette_lookup`, as a tuple of normalized R,G,B floats.
+        Always interpolates, even if a table was precomputed.
+        """
+        position %= 1.0  # Wrap palette position in 0.0 to <1.0 range
+        weight2 = position * self._length  # Scale position to palette length
+        idx = int(weight2)  # Index of 'lower' color (0 to len-1)
+        weight2 -= idx  # Weighting of 'upper' color
+        if idx >= self._length:  # Tiny negative positions can wrap to 1.0
+            idx = 0
+        weight1 = 1.0 - weight2
+        rgb = self._rgb
+        idx *= 3
+        return (
+            rgb[idx] * weight1 + rgb[idx + 3] * weight2,
+            rgb[idx + 1] * weight1 + rgb[idx + 4] * weight2,
+            rgb[idx + 2] * weight1 + rgb[idx + 5] * weight2,
+        )
+
+    def lookup(self, position: float) -> int:
+        """Fetch color at palette position (0.0 to 1.0, wraps around).
+
+        :returns: 24-bit integer a la ``0x00RRGGBB``.
+        """
+        table = self.table
+        if table is None:
+            return _pack_rgb(*self.sample(position))
+        return table[int((position % 1.0) * self.steps) % self.steps]
+
+    def lookup_u8(self, index: int) -> int:
+        """Fetch color at 8-bit palette position (0 to 255, wraps around),
+        i.e. position index / 256.
+
+        :returns: 24-bit integer a la ``0x00RRGGBB``.
+        """
+        table = self.table
+        if table is None:
+            return _pack_rgb(*self.sample((index & 0xFF) / 256.0))
+        return table[((index & 0xFF) * self.steps) >> 8]
+
+
+class GradientPalette(Palette):
+    """Gradient palette sampled directly, without expanding it first.
+
+    Built from the same list of (position, color) items as
+    `expand_gradient`, and looked up with the same methods as `Palette`
+    (it can be passed to `palette_lookup_many`). Each lookup finds the
+    gradient segment with a binary search and interpolates from that
+    segment's precomputed start color and slope, so memory use grows with
+    the number of items rather than a palette length, and colors aren't
+    interpolated twice. As with expand_gradient(), positions before the
+    first item or after the last use that item's color; positions wrap
+    around as with palette_lookup(). `CHSV` items are converted to RGB.
+
+    .. code-block:: python
+
+          palette = GradientPalette([(0.0, 0xFFFFFF), (0.25, 0xFFFF00), (1.0, 0x000000)])
+          pixels[i] = palette.lookup(i / num_leds)
+
+    :param gradient: list or tuple of 2-element lists/tuples containing
+      position (0.0 to 1.0) and color (packed int, CRGB or CHSV).
+    :param int steps: optional number of precomputed table entries, as
+      with `Palette`.
+    """
+
+    def __init__(
+        self,
+        gradient: Union[
+            list[list[float, Union[int, CRGB, CHSV]]],
+            tuple[tuple[float, Union[int, CRGB, CHSV]]],
+        ],
+        steps: Optional[int] = None,
+    ) -> None:
+        gradient = sorted(gradient, key=lambda item: item[0])
+        self._length = len(gradient)
+        self._positions = [item[0] for item in gradient]
+        colors = [_to_rgb(item[1]) for item in gradient]
+        # Segment i runs from item i to item i + 1: start color and change
+        # in color per unit of position. Zero-width segments are never
+        # selected by sample(), so their slope is left at zero.
+        start = []
+        slope = []
+        for i, color in enumerate(colors):
+            start.extend(color)
+            width = self._positions[i + 1] - self._positions[i] if i < len(colors) - 1 else 0
+            for channel in range(3):
+                if width > 0:
+                    slope.append((colors[i + 1][channel] - color[channel]) / width)
+                else:
+                    slope.append(0.0)
+        self._start = start
+        self._slope = slope
+        self._build_table(steps)
+
+    @classmethod
+    def from_bytes(cls, src: bytes, steps: Optional[int] = None) -> GradientPalette:
+        """Build from FastLED-style gradient palette bytes, as used with
+        fastled_helpers.loadDynamicGradientPalette(): four bytes per item,
+        a position (0-255) followed by R, G and B (0-255).
+        """
+        return cls(
+            [
+                (src[i] / 255.0, CRGB(src[i + 1], src[i + 2], src[i + 3]))
+                for i in range(0, len(src), 4)
+            ],
+            steps,
+        )
+
+    def sample(self, position: float) -> tuple[float, float, float]:
+        """Interpolated color at palette position (0.0 to 1.0, wraps around)
+        as a tuple of normalized R,G,B floats.
+        """
+        position %= 1.0
+        positions = self._positions
+        last = self._length - 1
+        if position <= positions[0]:
+            idx = 0  # Off bottom - use first item's color
+            position = positions[0]
+        elif position >= positions[last]:
+            idx = last  # Off top - use last item's color
+            position = positions[last]
+        else:
+            # Binary search for the last item at or before position
+            # (always before the last item, since position is below it).
+            idx, high = 0, last - 1
+            while idx < high:
+                mid = (idx + high + 1) >> 1
+                if positions[mid] <= position:
+                    idx = mid
+                else:
+                    high = mid - 1
+        delta = position - positions[idx]
+        idx *= 3
+        start = self._start
+        slope = self._slope
+        return (
+            start[idx] + slope[idx] * delta,
+            start[idx + 1] + slope[idx + 1] * delta,
+            start[idx + 2] + slope[idx + 2] * delta,
+        )
+
+
+def palette_lookup_many(  # noqa: PLR0912, PLR0913, PLR0917, too-many-branches
+    palette: Union[Palette, list[CRGB], list[CHSV], list[int]],
+    out: Any,
+    offset: float = 0.0,
+    step: Optional[float] = None,
+    positions: Optional[Any] = None,
+    gamma_value: Any = None,
+    brightness: Optional[Union[float, tuple[float, float, float]]] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Any:
+    """Fetch a whole strip's worth of interpolated palette colors at once,
+    writing packed colors straight into an output buffer. Replaces a loop
+    of palette_lookup(), gamma_adjust() and pack() calls, without creating
+    any intermediate `CRGB` objects:
+
+    .. code-block:: python
+
+          palette = Palette([CRGB(1.0, 0.0, 0.0), CRGB(0.0, 0.0, 1.0)])
+          buf = [0] * num_leds
+          palette_lookup_many(palette, buf, offset, brightness=0.25)
+          pixels[:] = buf
+
+    :param palette: `Palette`, or a list of CRGB, CHSV and/or packed
+      integers (compiled into a `Palette` on each call -- pass a `Palette`
+      to avoid that when calling repeatedly).
+    :param out: mutable sequence (list, ``array('I')``, NeoPixel object...)
+      receiving 24-bit packed integers, OR a bytearray or memoryview
+      receiving 3 bytes (R, G, B) per color.
+    :param float offset: palette position of the first color.
+    :param float step: palette position increment per color; default spans
+      the whole palette once across the output.
+    :param positions: optional sequence of palette positions (one per color
+      to write, 'offset' is added to each) to use instead of 'step'.
+      8-bit integer data -- bytes, bytearray, ``array('B')``, a byte
+      memoryview or a uint8 NumPy array of any shape, such as a noise
+      field -- holds 8-bit positions, 0 to 255 spanning the palette once.
+    :param gamma_value: optional gamma factor, (R,G,B) tuple or
+      `GammaTable`, as with `gamma_adjust`. If this or 'brightness' is
+      given, colors are gamma-corrected before packing.
+    :param brightness: optional brightness (0.0 to 1.0) or (R,G,B) tuple.
+    :param int start: index of the first color to write (default 0).
+    :param int stop: index after the last color to write (default is all
+      of them). Only colors 'start' to 'stop' of the output are written,
+      computed exactly as when writing the whole output, so one frame can
+      be rendered in separate pieces (e.g. by several processes).
+    :returns: 'out'.
+    """
+    if not isinstance(palette, Palette):
+        palette = Palette(palette)
+    as_bytes = isinstance(out, (bytearray, memoryview))
+    u8_positions = False
+    if positions is not None:
+        # 8-bit positions wrap the same way signed or not (-1 and 255 are
+        # a whole turn apart), so signed buffers are fine as they are
+        values = _byte_values(positions, signed=True)
+        if values is not None:
+            positions = values
+            u8_positions = True
+        count = len(positions)
+    else:
+        count = len(out) // 3 if as_bytes else len(out)
+        if step is None:
+            step = 1.0 / count if count else 0.0
+    gamma = None
+    if gamma_value is not None or brightness is not None:
+        gamma = _gamma_table(gamma_value, 1.0 if brightness is None else brightness)
+        size = gamma.size
+        curves = (gamma.red, gamma.green, gamma.blue)
+        exact = gamma.exact
+    table = palette.table
+    steps = palette.steps
+    sample = palette.sample
+    if stop is None or stop > count:
+        stop = count
+
+    for i in range(start, stop):
+        if positions is None:
+            pos = offset + i * step
+        elif u8_positions:
+            pos = offset + positions[i] / 256.0
+        else:
+            pos = offset + positions[i]
+        if gamma is not None:
+            red, green, blue = sample(pos)
+            if exact:
+                packed = _pack_rgb(*gamma.levels(red, green, blue))
+            else:
+                packed = _pack_rgb(
+                    _interpolate(curves[0], red * size),
+                    _interpolate(curves[1], green * size),
+                    _interpolate(curves[2], blue * size),
+                )
+        elif table is not None:
+            packed = table[int((pos % 1.0) * steps) % steps]
+        else:
+            packed = _pack_rgb(*sample(pos))
+        if as_bytes:
+            j = i * 3
+            out[j] = packed >> 16
+            out[j + 1] = (packed >> 8) & 0xFF
+            out[j + 2] = packed & 0xFF
+        else:
+            out[i] = packed
+    return out
+
+
+def _pack_rgb(red: float, green: float, blue: float) -> int:
+    """'Pack' normalized R,G,B floats into a 24-bit integer (each channel
+    converted as with denormalize()).
+    """
+    red = int(red * 256.0)
+    green = int(green * 256.0)
+    blue = int(blue * 256.0)
+    return (
+        ((0 if red < 0 else 255 if red > 255 else red) << 16)
+        | ((0 if green < 0 else 255 if green > 255 else green) << 8)
+        | (0 if blue < 0 else 255 if blue > 255 else blue)
+    )
+
+
+def pack_into(  # noqa: PLR0912, PLR0913, PLR0915, PLR0917, too-many-branches
+    colors: Union[PixelFrame, list[Union[CRGB, CHSV, int]], Any],
+    buf: Union[bytearray, memoryview],
+    order: str = "RGB",
+    white: Optional[Union[float, int]] = None,
+    gamma: Optional[GammaTable] = None,
+    dirty_only: bool = False,
+    power: Optional[Any] = None,
+) -> Union[bytearray, memoryview]:
+    """Encode a whole frame of colors directly into a pixel byte buffer,
+    in the byte order the LED strip expects, e.g. to copy into a NeoPixel
+    or DotStar strip's buffer. No packed integer or tuple is created per
+    pixel along the way.
+
+    .. code-block:: python
+
+          buf = bytearray(3 * len(frame))
+          pack_into(frame, buf, "GRB", gamma=GammaTable.get(brightness=0.25))
+
+    :param colors: `PixelFrame`, list of `CRGB`, `CHSV` and/or packed
+      integers, or an ``array`` of packed integers.
+    :param buf: bytearray or memoryview of at least len(colors) times
+      len(order) bytes.
+    :param str order: byte order of each pixel, e.g. "RGB" (default),
+      "GRB", "BGR", "RGBW" or "GRBW".
+    :param white: value for the white byte of RGBW orders: integer 0 to
+      255 or float 0.0 to 1.0, same for every pixel (default is 0). As
+      with CRGB.pack(), this is NOT white component replacement.
+    :param gamma: optional `GammaTable` or transform.ChannelTransform applied to
+      the R,G,B values (packed integer colors go through its 8-bit `lut`).
+    :param bool dirty_only: for a `PixelFrame`, only encode pixels changed
+      since its last `PixelFrame.clear_dirty` (the rest of 'buf' is left
+      as it was). Ignored for other frame types.
+    :param power: optional `adafruit_fancyled.power.PowerBudget` to keep
+      the frame within. Its scale is applied through 'gamma', which must
+      then be a transform.ChannelTransform (or None for no gamma
+      correction). If the scale
+      changes, a `PixelFrame` is packed (and marked dirty) in full.
+    :returns: 'buf'.
+    """
+    bpp = len(order)
+    red_at = order.index("R")
+    green_at = order.index("G")
+    blue_at = order.index("B")
+    white_at = order.find("W")
+    if white_at >= 0:
+        if isinstance(white, float):
+            white = denormalize(white)
+        else:
+            white = clamp(white or 0, 0, 255)
+    if power is not None:
+        gamma, changed = power._prepare(colors, gamma, order)
+        if changed and isinstance(colors, PixelFrame):
+            # Every pixel's output changes, not just the dirty ones
+            colors._all_dirty = True
+    if gamma is not None:
+        gamma = _gamma_table(gamma, None)
+        size = gamma.size
+        curve_red, curve_green, curve_blue = gamma.red, gamma.green, gamma.blue
+        exact = gamma.exact
+
+    frame = colors.rgb if isinstance(colors, PixelFrame) else None
+    packed = frame is None and isinstance(colors, array)
+    lut = gamma.lut if gamma is not None and frame is None else None
+    count = len(frame) // 3 if frame is not None else len(colors)
+    if dirty_only and frame is not None:
+        spans = colors.dirty_spans()
+    else:
+        spans = ((0, count),)
+    for start, stop in spans:
+        for i in range(start, stop):
+            if frame is not None:
+                j = i * 3
+                red, green, blue = frame[j], frame[j + 1], frame[j + 2]
+            else:
+                color = colors[i]
+                if packed or isinstance(color, int):
+                    # Already 8-bit, no float conversion needed
+                    j = i * bpp
+                    if lut is None:
+                        buf[j + red_at] = (color >> 16) & 0xFF
+                        buf[j + green_at] = (color >> 8) & 0xFF
+                        buf[j + blue_at] = color & 0xFF
+                    else:
+                        buf[j + red_at] = lut[(color >> 16) & 0xFF]
+                        buf[j + green_at] = lut[256 + ((color >> 8) & 0xFF)]
+                        buf[j + blue_at] = lut[512 + (color & 0xFF)]
+                    if white_at >= 0:
+                        buf[j + white_at] = white
+                    continue
+                else:
+                    if isinstance(color, CHSV):
+                        color = CRGB(color)
+                    red, green, blue = color.red, color.green, color.blue
+            if gamma is not None:
+                if exact:
+                    red, green, blue = gamma.levels(red, green, blue)
+                else:
+                    red = _interpolate(curve_red, red * size)
+                    green = _interpolate(curve_green, green * size)
+                    blue = _interpolate(curve_blue, blue * size)
+            # Same bucketing as denormalize()
+            red = int(red * 256.0)
+            green = int(green * 256.0)
+            blue = int(blue * 256.0)
+            j = i * bpp
+            buf[j + red_at] = 0 if red < 0 else 255 if red > 255 else red
+            buf[j + green_at] = 0 if green < 0 else 255 if green > 255 else green
+            buf[j + blue_at] = 0 if blue < 0 else 255 if blue > 255 else blue
+            if white_at >= 0:
+                buf[j + white_at] = white
+    return buf
+
+
+HUE_STEPS = 1536  # Hue circle resolution of fill_rainbow(), hsv_to_rgb_many()
+
+# Red level (0 to 256) around the hue circle at full saturation and value,
+# in HUE_STEPS steps. Green and blue follow the same curve, one and two
+# thirds of the way around the circle behind red. Built on first use.
+_hue_curve = array("H")
+
+
+def _hue_levels() -> Any:
+    """Hue curve table, built on first call."""
+    if not _hue_curve:
+        sextant = HUE_STEPS // 6
+        for i in range(HUE_STEPS):
+            sxt, frac = divmod(i, sextant)
+            frac = (frac * 256) // sextant
+            # Red is full, falling, off, off, rising, full (see _hsv_to_rgb)
+            _hue_curve.append((256, 256 - frac, 0, 0, frac, 256)[sxt])
+    return _hue_curve
+
+
+def _hsv_packed(curve: Any, hue: float, scale: float, floor_level: float) -> int:
+    """Table-driven HSV to 24-bit RGB, hue 0.0 to 1.0 (wraps around). For
+    saturation s and value v, 'scale' is s * v and 'floor_level' is
+    (1 - s) * v * 256 (matching the _hsv_to_rgb() math in 8-bit units).
+    """
+    idx = int((hue % 1.0) * HUE_STEPS) % HUE_STEPS
+    red = int(curve[idx] * scale + floor_level)
+    green = int(curve[(idx + 1024) % HUE_STEPS] * scale + floor_level)
+    blue = int(curve[(idx + 512) % HUE_STEPS] * scale + floor_level)
+    return (
+        ((255 if red > 255 else red) << 16)
+        | ((255 if green > 255 else green) << 8)
+        | (255 if blue > 255 else blue)
+    )
+
+
+def fill_rainbow(
+    out: Any,
+    start_hue: float = 0.0,
+    hue_step: Optional[float] = None,
+    sat: Union[float, int] = 1.0,
+    val: Union[float, int] = 1.0,
+) -> Any:
+    """Fill a buffer with a rainbow of hues, a la FastLED's fill_rainbow().
+    Uses a precomputed hue table (HUE_STEPS steps around the hue circle)
+    rather than converting a `CHSV` per pixel; results may differ from
+    CRGB(CHSV(...)).pack() by one 8-bit step.
+
+    :param out: mutable sequence (list, ``array('I')``, NeoPixel object...)
+      receiving 24-bit packed integers, OR a bytearray or memoryview
+      receiving 3 bytes (R, G, B) per color.
+    :param start_hue: hue of the first pixel, as with `CHSV` (float, any
+      range, or integer 0-256 -> 0.0-1.0).
+    :param hue_step: hue increment per pixel (same units); default spans
+      the whole hue circle once across the output.
+    :param sat: saturation, float 0.0 to 1.0 or integer 0 to 255.
+    :param val: value, float 0.0 to 1.0 or integer 0 to 255.
+    :returns: 'out'.
+    """
+    as_bytes = isinstance(out, (bytearray, memoryview))
+    count = len(out) // 3 if as_bytes else len(out)
+    if not isinstance(start_hue, float):
+        start_hue = start_hue / 256.0
+    if hue_step is None:
+        hue_step = 1.0 / count if count else 0.0
+    elif not isinstance(hue_step, float):
+        hue_step = hue_step / 256.0
+    sat = clamp_norm(sat)
+    val = clamp_norm(val)
+    scale = sat * val
+    floor_level = (1.0 - sat) * val * 256.0
+    curve = _hue_levels()
+    for i in range(count):
+        packed = _hsv_packed(curve, start_hue + i * hue_step, scale, floor_level)
+        if as_bytes:
+            j = i * 3
+            out[j] = packed >> 16
+            out[j + 1] = (packed >> 8) & 0xFF
+            out[j + 2] = packed & 0xFF
+        else:
+            out[i] = packed
+    return out
+
+
+def hsv_to_rgb_many(colors: list[CHSV], out: Any) -> Any:
+    """Convert a list of `CHSV` colors to packed RGB in one pass, using the
+    same hue table as fill_rainbow() (results may differ from
+    CRGB(CHSV(...)).pack() by one 8-bit step).
+
+    :param colors: list of `CHSV` colors.
+    :param out: mutable sequence receiving 24-bit packed integers, OR a
+      bytearray or memoryview receiving 3 bytes (R, G, B) per color.
+    :returns: 'out'.
+    """
+    as_bytes = isinstance(out, (bytearray, memoryview))
+    curve = _hue_levels()
+    for i, color in enumerate(colors):
+        val = color.value
+        packed = _hsv_packed(
+            curve,
+            color.hue,
+            color.saturation * val,
+            (1.0 - color.saturation) * val * 256.0,
+        )
+        if as_bytes:
+            j = i * 3
+            out[j] = packed >> 16
+            out[j + 1] = (packed >> 8) & 0xFF
+            out[j + 2] = packed & 0xFF
+        else:
+            out[i] = packed
+    return out
+
+
 def expand_gradient(
     gradient: Union[
         list[list[float, Union[int, CRGB, CHSV]]],
         tuple[tuple[float, Union[int, CRGB, CHSV]]],
     ],
     length: float,
-) -> list[CRGB]:
+    out: Optional[Any] = None,
+) -> Union[list[CRGB], Any]:
     """Convert gradient palette into standard equal-interval palette.
 
     :param sequence gradient: List or tuple of of 2-element lists/tuples
       containing position (0.0 to 1.0) and color (packed int, CRGB or CHSV).
       It's OK if the list/tuple elements are either lists OR tuples, but
       don't mix and match lists and tuples -- use all one or the other.
+    :param int length: number of palette entries to generate.
+    :param out: optional `PixelFrame`, or mutable sequence of packed
+      integers (list, ``array('I')``...), at least 'length' long, to
+      receive the palette instead of allocating a `CRGB` per entry.
 
-    :returns: CRGB list, can be used with palette_lookup() function.
+    :returns: CRGB list, can be used with palette_lookup() function, or
+      'out' if provided.
     """
 
     gradient = sorted(gradient)  # Sort list by position values
-    least = gradient[0][0]  # Lowest position value (ostensibly 0.0)
-    most = gradient[-1][0]  # Highest position value (ostensibly 1.0)
+    if out is not None:
+        return _expand_gradient_into(gradient, length, out)
     newlist = []
 
+    for pos, below, above in _gradient_brackets(gradient, length):
+        # Range between below, above
+        r = gradient[above][0] - gradient[below][0]
+        if r <= 0:
+            newlist.append(gradient[below][1])  # Use 'below' color only
+        else:
+            weight2 = (pos - gradient[below][0]) / r  # Weight of 'above' color
+            color1 = gradient[below][1]
+            color2 = gradient[above][1]
+            # Interpolate and add to list
+            newlist.append(mix(color1, color2, weight2))
+
+    return newlist
+
+
+def _gradient_brackets(gradient: Any, length: int) -> Any:
+    """Generate (position, below, above) for each of 'length' equal-interval
+    positions across a sorted gradient, where 'below' and 'above' are the
+    indices of the gradient items on either side of the position.
+    """
+    least = gradient[0][0]  # Lowest position value (ostensibly 0.0)
+    most = gradient[-1][0]  # Highest position value (ostensibly 1.0)
+    last = len(gradient) - 1
+    # Positions only increase, so the items bracketing each one are found
+    # with a single forward sweep through the gradient: 'seek_below' is the
+    # last item at or before pos, 'seek_above' the first item (past the
+    # first) at or after pos.
+    seek_below, seek_above = 0, 1
     for i in range(length):
         pos = i / float(length - 1)  # 0.0 to 1.0 in 'length' steps
         # Determine indices in list of item 'below' and 'above' pos
         if pos <= least:
             # Off bottom of list - use lowest index
-            below, above = 0, 0
+            yield pos, 0, 0
         elif pos >= most:
             # Off top of list - use highest index
-            below, above = -1, -1
+            yield pos, last, last
         else:
-            # Seek position between two items in list
-            below, above = 0, -1
-            for n, x in enumerate(gradient):
-                if pos >= x[0]:
-                    below = n
-            for n, x in enumerate(gradient[-1:0:-1]):
-                if pos <= x[0]:
-                    above = -1 - n
-
-        # Range between below, above
+            # Advance to items on either side of pos
+            while seek_below < last and gradient[seek_below + 1][0] <= pos:
+                seek_below += 1
+            while gradient[seek_above][0] < pos:
+                seek_above += 1
+            yield pos, seek_below, seek_above
+
+
+def _expand_gradient_into(gradient: Any, length: int, out: Any) -> Any:
+    """expand_gradient() into a PixelFrame or packed-integer sequence."""
+    # Convert item colors once. Pairs of CHSV items still go through mix(),
+    # as those interpolate in HSV space.
+    stops = [_to_rgb(x[1]) for x in gradient]
+    hsv = [isinstance(x[1], CHSV) for x in gradient]
+    frame = None
+    if isinstance(out, PixelFrame):
+        frame = out.rgb
+        out.mark_dirty()
+
+    for i, (pos, below, above) in enumerate(_gradient_brackets(gradient, length)):
         r = gradient[above][0] - gradient[below][0]
         if r <= 0:
-            newlist.append(gradient[below][1])  # Use 'below' color only
+            red, green, blue = stops[below]  # Use 'below' color only
         else:
             weight2 = (pos - gradient[below][0]) / r  # Weight of 'above' color
-            color1 = gradient[below][1]
-            color2 = gradient[above][1]
-            # Interpolate and add to list
-            newlist.append(mix(color1, color2, weight2))
+            if hsv[below] and hsv[above]:
+                red, green, blue = _to_rgb(mix(gradient[below][1], gradient[above][1], weight2))
+            else:
+                # Same interpolation as mix()
+                weight1 = 1.0 - weight2
+                red1, green1, blue1 = stops[below]
+                red2, green2, blue2 = stops[above]
+                red = red1 * weight1 + red2 * weight2
+                green = green1 * weight1 + green2 * weight2
+                blue = blue1 * weight1 + blue2 * weight2
+        if frame is None:
+            out[i] = _pack_rgb(red, green, blue)
+        else:
+            j = i * 3
+            frame[j] = red
+            frame[j + 1] = green
+            frame[j + 2] = blue
 
-    return newlist
+    return out
@@ -27,6 +27,26 @@ from adafruit_fancyled import adafruit_fancyled as fancy
 
 GFACTOR = 2.5  # Default gamma-correction factor for function below
 
+# FastLED's color correction and color temperature presets, for use with
+# transform.ChannelTransform (e.g. ChannelTransform(correction=TypicalLEDStrip))
+
+TypicalSMD5050 = 0xFFB0F0
+TypicalLEDStrip = 0xFFB0F0
+Typical8mmPixel = 0xFFE08C
+TypicalPixelString = 0xFFE08C
+UncorrectedColor = 0xFFFFFF
+
+Candle = 0xFF9329
+Tungsten40W = 0xFFC58F
+Tungsten100W = 0xFFD6AA
+Halogen = 0xFFF1E0
+CarbonArc = 0xFFFAF4
+HighNoonSun = 0xFFFFFB
+DirectSunlight = 0xFFFFFF
+OvercastSky = 0xC9E2FF
+ClearBlueSky = 0x409CFF
+UncorrectedTemperature = 0xFFFFFF
+
 
 def applyGamma_video(n, g_r=GFACTOR, g_g=None, g_b=None, inplace=False):
     """Approximates various invocations of FastLED's many-ways-overloaded
@@ -52,6 +72,12 @@ def applyGamma_video(n, g_r=GFACTOR, g_g=None, g_b=None, inplace=False):
 
       In the tuple/list cases, there is NO return value if 'inplace'
       is true -- the original values are modified.
+
+      Colors are corrected through FancyLED's cached gamma tables, so
+      repeated calls with the same gamma(s) don't recompute pow() per
+      pixel. A prebuilt fancy.GammaTable may also be passed as 'g_r', or
+      a transform.ChannelTransform to also apply brightness, color correction
+      and color temperature in the same pass.
     """
 
     # If single gamma value is passed, keep that, otherwise convert
@@ -83,6 +109,10 @@ def loadDynamicGradientPalette(src, size):
              to be allocated.
 
     RETURNS: list of CRGB colors.
+
+    If the palette is only going to be sampled (e.g. with palette_lookup()),
+    fancy.GradientPalette.from_bytes(src) accepts the same bytes and skips
+    expanding the palette altogether.
     """
 
     # Convert gradient from bytelist (groups of 4) to list of tuples,
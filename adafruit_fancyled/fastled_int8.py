@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.fastled_int8`
+====================================================
+
+Integer (8-bit) counterpart to `adafruit_fancyled.fastled_helpers`, for
+porting Arduino FastLED sketches that lean on its 8-bit math. Everything
+here works on 0-255 integers, packed 24-bit ``0xRRGGBB`` integers and byte
+buffers, and never touches floating-point math, which is slow on boards
+without a floating-point unit.
+
+Frames are either bytearrays (or memoryviews) of R,G,B bytes, three per
+pixel, or mutable sequences of packed integers (list, ``array('I')``...).
+Palettes are bytes-like (R,G,B bytes per entry) or sequences of packed
+integers.
+
+FastLED's inoise8() and inoise16() noise functions are in
+`adafruit_fancyled.noise`.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+# These mirror FastLED's lib8tion functions, using the same integer math
+# as FastLED built with FASTLED_SCALE8_FIXED (the default), so results
+# match FastLED sketches.
+
+
+def scale8(i, scale):
+    """Scale 'i' (0-255) by 'scale' (0-255), treating scale as a fraction
+    of 256 where 255 leaves 'i' unchanged. Like FastLED's scale8().
+    """
+    return (i * (1 + scale)) >> 8
+
+
+def scale8_video(i, scale):
+    """Like scale8(), but a nonzero 'i' scaled by a nonzero 'scale' never
+    drops to zero (so lit pixels stay lit). Like FastLED's scale8_video().
+    """
+    return ((i * scale) >> 8) + (1 if i and scale else 0)
+
+
+def qadd8(i, j):
+    """Add two 0-255 values, saturating at 255. Like FastLED's qadd8()."""
+    total = i + j
+    return 255 if total > 255 else total
+
+
+def qsub8(i, j):
+    """Subtract 'j' from 'i', saturating at 0. Like FastLED's qsub8()."""
+    difference = i - j
+    return 0 if difference < 0 else difference
+
+
+def blend8(a, b, amount_of_b):
+    """Blend between two 0-255 values, 'amount_of_b' (0-255) being the
+    weighting of 'b'. Like FastLED's blend8().
+    """
+    partial = (a << 8) | b
+    partial += b * amount_of_b
+    partial -= a * amount_of_b
+    return partial >> 8
+
+
+def nscale8(leds, scale):
+    """Scale every pixel in a frame by 'scale' (0-255) in-place, like
+    FastLED's nscale8(). 'leds' is a bytearray/memoryview of R,G,B bytes,
+    or a mutable sequence of packed integers.
+    """
+    scale += 1  # Same as scale8(), hoisted out of the loop
+    if isinstance(leds, (bytearray, memoryview)):
+        for i in range(len(leds)):
+            leds[i] = (leds[i] * scale) >> 8
+        return
+    for i in range(len(leds)):
+        color = leds[i]
+        leds[i] = (
+            (((((color >> 16) & 0xFF) * scale) >> 8) << 16)
+            | (((((color >> 8) & 0xFF) * scale) >> 8) << 8)
+            | (((color & 0xFF) * scale) >> 8)
+        )
+
+
+def fadeToBlackBy(leds, fade_by):
+    """Dim every pixel in a frame by 'fade_by' (0-255) 256ths of its
+    brightness in-place, like FastLED's fadeToBlackBy().
+    """
+    nscale8(leds, 255 - fade_by)
+
+
+def ColorFromPalette(pal, pos, brightness=255, blend=False):
+    """Integer version of fastled_helpers.ColorFromPalette().
+
+    ACCEPTS: color palette (bytes-like, three R,G,B bytes per entry, or
+             sequence of packed integers), palette index (x16) + blend
+             factor of next index (0-15) -- e.g. pass 32 to retrieve palette
+             index 2, or 40 for an interpolated value between palette index
+             2 and 3 (for a 16-entry palette, 0-255 covers the whole palette,
+             as with FastLED's CRGBPalette16), optional brightness (0-255,
+             applied with the same math as FastLED's ColorFromPalette()),
+             optional blend flag.
+
+    RETURNS: packed 24-bit integer color, no gamma correction
+    """
+
+    as_bytes = isinstance(pal, (bytes, bytearray, memoryview))
+    length = len(pal) // 3 if as_bytes else len(pal)
+    hi4 = (pos >> 4) % length
+    lo4 = pos & 0x0F
+    if as_bytes:
+        red, green, blue = pal[hi4 * 3], pal[hi4 * 3 + 1], pal[hi4 * 3 + 2]
+    else:
+        color = pal[hi4]
+        red, green, blue = (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+
+    if blend and lo4:
+        nxt = (hi4 + 1) % length
+        if as_bytes:
+            red2, green2, blue2 = pal[nxt * 3], pal[nxt * 3 + 1], pal[nxt * 3 + 2]
+        else:
+            color = pal[nxt]
+            red2, green2, blue2 = (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+        # Weightings of the two entries, as in FastLED
+        f2 = lo4 << 4
+        f1 = 255 - f2
+        red = scale8(red, f1) + scale8(red2, f2)
+        green = scale8(green, f1) + scale8(green2, f2)
+        blue = scale8(blue, f1) + scale8(blue2, f2)
+
+    if brightness != 255:
+        if brightness:
+            # As in FastLED: brightness is bumped by one (for rounding) before
+            # scale8(), which itself scales by one more than its argument
+            brightness += 1
+            red = scale8(red, brightness)
+            green = scale8(green, brightness)
+            blue = scale8(blue, brightness)
+        else:
+            red = green = blue = 0
+
+    return (red << 16) | (green << 8) | blue
+
+
+def hsv2rgb_rainbow(hue, sat, val):  # noqa: PLR0912, too-many-branches
+    """Port of FastLED's hsv2rgb_rainbow() function (with its default
+    settings): the 'rainbow' hue map, which gives yellow and orange more
+    of the hue circle than hsv2rgb_spectrum() does.
+
+    ACCEPTS: hue, saturation, value in range 0 to 255
+    RETURNS: packed 24-bit integer color
+    """
+
+    offset8 = (hue & 0x1F) << 3  # Position within 1/8th of hue circle
+    third = scale8(offset8, 85)  # max = 85
+
+    if not hue & 0x80:
+        if not hue & 0x40:
+            if not hue & 0x20:  # Red -> orange
+                red, green, blue = 255 - third, third, 0
+            else:  # Orange -> yellow
+                red, green, blue = 171, 85 + third, 0
+        elif not hue & 0x20:  # Yellow -> green
+            twothirds = scale8(offset8, 170)  # max = 170
+            red, green, blue = 171 - twothirds, 170 + third, 0
+        else:  # Green -> aqua
+            red, green, blue = 0, 255 - third, third
+    elif not hue & 0x40:
+        if not hue & 0x20:  # Aqua -> blue
+            twothirds = scale8(offset8, 170)  # max = 170
+            red, green, blue = 0, 171 - twothirds, 85 + twothirds
+        else:  # Blue -> purple
+            red, green, blue = third, 0, 255 - third
+    elif not hue & 0x20:  # Purple -> pink
+        red, green, blue = 85 + third, 0, 171 - third
+    else:  # Pink -> red
+        red, green, blue = 170 + third, 0, 85 - third
+
+    # Scale down colors if desaturated at all, and add the brightness floor
+    if sat != 255:
+        if sat == 0:
+            red, green, blue = 255, 255, 255
+        else:
+            desat = scale8_video(255 - sat, 255 - sat)
+            satscale = 255 - desat
+            red = (scale8(red, satscale) + desat) & 0xFF
+            green = (scale8(green, satscale) + desat) & 0xFF
+            blue = (scale8(blue, satscale) + desat) & 0xFF
+
+    # Scale everything down if value < 255
+    if val != 255:
+        val = scale8_video(val, val)
+        red = scale8(red, val) if val else 0
+        green = scale8(green, val) if val else 0
+        blue = scale8(blue, val) if val else 0
+
+    return (red << 16) | (green << 8) | blue
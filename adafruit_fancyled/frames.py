@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.frames`
+====================================================
+
+Whole-frame blending, for crossfading scenes: blend_frames() mixes two
+frames into a third and nblend() fades a frame toward another in-place,
+like FastLED's function of the same name. Frames can be PixelFrames,
+pixel byte buffers or lists/arrays of colors. Kept out of the main
+FancyLED module so that projects not using it don't pay for it in RAM.
+
+.. code-block:: python
+
+      from adafruit_fancyled import frames
+
+      frames.blend_frames(out, scene_a, scene_b, fade)
+      frames.nblend(trail, current, 0.2)
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+from array import array
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+
+try:
+    from typing import Any, Optional
+except ImportError:
+    pass
+
+
+def blend_frames(dst: Any, src_a: Any, src_b: Any, weight2: float = 0.5) -> Any:
+    """Blend two whole frames pixel by pixel into a third, as with mix()
+    on each pair of colors (in RGB space), e.g. to crossfade two scenes.
+
+    A frame is a PixelFrame, a bytearray/memoryview of R,G,B bytes, an
+    ``array`` or list of packed integers, or a list of CRGB, CHSV and/or
+    packed integers. Each frame's type is worked out once, not per
+    pixel, and frames may be of different types (at the cost of a
+    temporary conversion). When all three are byte buffers, or all three
+    are packed integers, the blend is done in 8-bit integer math (as with
+    FastLED's blend8()) without any floats. CRGB objects in a list
+    'dst' are updated in-place rather than replaced. 'dst' may be one of
+    the sources.
+
+    :param dst: frame to receive the result.
+    :param src_a: first frame.
+    :param src_b: second frame, same number of pixels as the first.
+    :param float weight2: weighting (0.0 to 1.0) of the second frame.
+    :returns: 'dst'.
+    """
+    weight2 = fancy.clamp(weight2, 0.0, 1.0)
+    kind = _frame_kind(dst)
+    length = _frame_length(dst, kind)
+    if _frame_length(src_a) != length or _frame_length(src_b) != length:
+        raise ValueError("frame lengths differ")
+
+    if kind in {_BYTES_FRAME, _PACKED_FRAME} and kind == _frame_kind(src_a) == _frame_kind(src_b):
+        amount = int(weight2 * 256.0)  # 0 to 256, 256 = all of src_b
+        if kind == _BYTES_FRAME:
+            for i in range(len(dst)):
+                a = src_a[i]
+                dst[i] = a + (((src_b[i] - a) * amount) >> 8)
+            return dst
+        for i in range(length):
+            a = src_a[i]
+            b = src_b[i]
+            red = (a >> 16) & 0xFF
+            green = (a >> 8) & 0xFF
+            blue = a & 0xFF
+            dst[i] = (
+                ((red + (((((b >> 16) & 0xFF) - red) * amount) >> 8)) << 16)
+                | ((green + (((((b >> 8) & 0xFF) - green) * amount) >> 8)) << 8)
+                | (blue + ((((b & 0xFF) - blue) * amount) >> 8))
+            )
+        return dst
+
+    weight1 = 1.0 - weight2
+    rgb_a = _frame_floats(src_a)
+    rgb_b = _frame_floats(src_b)
+    if kind == _PIXEL_FRAME:
+        out = dst.rgb
+        dst.mark_dirty()
+    else:
+        out = array("f", bytearray(12 * length))
+    for i in range(len(out)):
+        out[i] = rgb_a[i] * weight1 + rgb_b[i] * weight2
+    if kind != _PIXEL_FRAME:
+        _store_floats(dst, kind, out)
+    return dst
+
+
+def nblend(dst: Any, src: Any, amount: float = 0.5) -> Any:
+    """Blend a whole frame in-place toward another, like FastLED's
+    nblend() (but with a 0.0 to 1.0 'amount' as in mix(), rather than
+    0 to 255). Frames are as in blend_frames().
+
+    :returns: 'dst'.
+    """
+    return blend_frames(dst, dst, src, amount)
+
+
+# Frame types for blend_frames()
+_PIXEL_FRAME = 0  # PixelFrame
+_BYTES_FRAME = 1  # bytearray, memoryview or bytes of R,G,B bytes
+_PACKED_FRAME = 2  # array or list of packed integers
+_COLOR_FRAME = 3  # list of CRGB, CHSV and/or packed integers
+
+
+def _frame_kind(frame: Any) -> int:
+    if isinstance(frame, fancy.PixelFrame):
+        return _PIXEL_FRAME
+    if isinstance(frame, (bytes, bytearray, memoryview)):
+        return _BYTES_FRAME
+    if isinstance(frame, array) or all(isinstance(color, int) for color in frame):
+        return _PACKED_FRAME
+    return _COLOR_FRAME
+
+
+def _frame_length(frame: Any, kind: Optional[int] = None) -> int:
+    """Number of pixels in a frame."""
+    if kind is None:
+        kind = _frame_kind(frame)
+    return len(frame) // 3 if kind == _BYTES_FRAME else len(frame)
+
+
+def _frame_floats(frame: Any) -> Any:
+    """A frame's colors as a flat sequence of normalized R,G,B floats
+    (a PixelFrame's own storage, otherwise a new array).
+    """
+    kind = _frame_kind(frame)
+    if kind == _PIXEL_FRAME:
+        return frame.rgb
+    if kind == _BYTES_FRAME:
+        return array("f", [value / 255.0 for value in frame])
+    out = array("f", bytearray(12 * len(frame)))
+    for i in range(len(frame)):
+        j = i * 3
+        color = frame[i]
+        if kind == _PACKED_FRAME:
+            # Same math as unpack()
+            out[j] = (color & 0xFF0000) / 16711680.0
+            out[j + 1] = (color & 0x00FF00) / 65280.0
+            out[j + 2] = (color & 0x0000FF) / 255.0
+        else:
+            out[j], out[j + 1], out[j + 2] = fancy._to_rgb(color)
+    return out
+
+
+def _store_floats(dst: Any, kind: int, rgb: Any) -> None:
+    """Copy flat normalized R,G,B floats into a non-PixelFrame frame."""
+    if kind == _BYTES_FRAME:
+        for i in range(len(rgb)):
+            value = int(rgb[i] * 256.0)  # Same bucketing as denormalize()
+            dst[i] = 255 if value > 255 else value
+        return
+    for i in range(len(dst)):
+        j = i * 3
+        if kind == _PACKED_FRAME:
+            dst[i] = fancy._pack_rgb(rgb[j], rgb[j + 1], rgb[j + 2])
+            continue
+        color = dst[i]
+        if isinstance(color, fancy.CRGB):
+            color.red, color.green, color.blue = rgb[j], rgb[j + 1], rgb[j + 2]
+        else:
+            dst[i] = fancy.CRGB.from_normalized(rgb[j], rgb[j + 1], rgb[j + 2])
@@ -0,0 +1,258 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.instrumentation`
+====================================================
+
+Opt-in counters and timers for finding where a frame's time goes: calls
+to each public FancyLED function and method, CHSV-to-RGB and unpack()
+conversions, CRGB/CHSV allocations and pow() calls, plus (optionally) the
+time spent in each function.
+
+Nothing is measured until enable() is called. It swaps counting wrappers
+into the adafruit_fancyled, fastled_helpers, fastled_int8, frames, power
+and transform modules (and their classes), and disable() puts the
+originals back, so the library runs at full speed when instrumentation
+is off. Code that grabbed a direct reference to a function (``from ...
+import mix``) before enable() keeps calling the unwrapped version; go
+through the module to be counted.
+
+Typical use, scoping the counters to one frame::
+
+    from adafruit_fancyled import instrumentation
+
+    with instrumentation.Collector(timing=True) as frame:
+        render()
+    print(frame.stats["calls"], frame.stats["time_ns"])
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+from time import monotonic_ns
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+from adafruit_fancyled import fastled_helpers, fastled_int8, frames, power, transform
+
+try:
+    from typing import Any, Callable, Optional
+except ImportError:
+    pass
+
+# Functions that do color conversions, also counted under "conversions"
+# with these names (as well as under "calls").
+_CONVERSIONS = {
+    "_hsv_to_rgb": "hsv_to_rgb",
+    "_hsv_packed": "hsv_to_rgb",
+    "unpack": "unpack",
+}
+
+_calls = {}  # Call counts by qualified name, e.g. "PixelFrame.mix"
+_time = {}  # Inclusive nanoseconds by qualified name (when timing)
+_conversions = {}  # Conversion counts by kind
+_allocations = {}  # Instance counts by class name
+_pow = [0]  # pow() call count (list so it's mutable without 'global')
+_patched = []  # (owner, attribute name, original value) while enabled
+
+
+def _function_type() -> None:
+    pass
+
+
+_FUNCTION = type(_function_type)
+
+
+def _count(counter: dict, key: str) -> None:
+    counter[key] = counter.get(key, 0) + 1
+
+
+def _wrap(func: Callable, name: str, timing: bool, conversion: Optional[str] = None) -> Callable:
+    """Wrap 'func' to count calls to it as 'name' (and as a 'conversion'
+    if given), accumulating its run time too if 'timing' is set.
+    """
+
+    if timing:
+
+        def wrapper(*args, **kwargs):
+            _count(_calls, name)
+            if conversion:
+                _count(_conversions, conversion)
+            start = monotonic_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _time[name] = _time.get(name, 0) + monotonic_ns() - start
+
+    elif conversion:
+
+        def wrapper(*args, **kwargs):
+            _count(_calls, name)
+            _count(_conversions, conversion)
+            return func(*args, **kwargs)
+
+    else:
+
+        def wrapper(*args, **kwargs):
+            _count(_calls, name)
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _wrap_allocation(init: Callable, name: str) -> Callable:
+    def wrapper(self, *args, **kwargs):
+        _count(_allocations, name)
+        init(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _counted_pow(*args):
+    _pow[0] += 1
+    return pow(*args)
+
+
+def _patch(owner: Any, attr: str, value: Any) -> None:
+    _patched.append((owner, attr, owner.__dict__.get(attr)))
+    setattr(owner, attr, value)
+
+
+def _patch_class(cls: type, timing: bool) -> None:
+    for attr, value in list(cls.__dict__.items()):
+        name = cls.__name__ + "." + attr
+        if attr == "__init__" and cls in {fancy.CRGB, fancy.CHSV}:
+            _patch(cls, attr, _wrap_allocation(value, cls.__name__))
+        elif attr.startswith("_"):
+            continue
+        elif isinstance(value, classmethod):
+            # Wrap the bound method; the new classmethod ignores its 'cls'
+            wrapped = _wrap(getattr(cls, attr), name, timing)
+            if attr == "from_normalized":
+                # Makes an instance without calling __init__, count it here
+                _patch(cls, attr, classmethod(_wrap_from_normalized(wrapped, cls.__name__)))
+            else:
+                _patch(cls, attr, classmethod(lambda _cls, *a, _w=wrapped, **k: _w(*a, **k)))
+        elif isinstance(value, _FUNCTION):
+            _patch(cls, attr, _wrap(value, name, timing))
+
+
+def _wrap_from_normalized(wrapped: Callable, name: str) -> Callable:
+    def wrapper(_cls, *args):
+        _count(_allocations, name)
+        return wrapped(*args)
+
+    return wrapper
+
+
+def enable(timing: bool = False) -> None:
+    """Start counting. If 'timing' is True, the inclusive time spent in
+    each function (including functions it calls) is accumulated as well,
+    at some extra overhead per call. Counters are not reset; see
+    reset_stats(). Calling enable() again switches the timing setting.
+    """
+
+    disable()
+    for module in (fancy, fastled_helpers, fastled_int8, frames, power, transform):
+        for attr, value in list(module.__dict__.items()):
+            if getattr(value, "__module__", None) != module.__name__:
+                continue  # Imported from elsewhere (typing, math...)
+            if isinstance(value, type):
+                _patch_class(value, timing)
+            elif isinstance(value, _FUNCTION) and (
+                not attr.startswith("_") or attr in _CONVERSIONS
+            ):
+                _patch(module, attr, _wrap(value, attr, timing, _CONVERSIONS.get(attr)))
+    # Shadow the pow() builtin within the main module's globals
+    _patch(fancy, "pow", _counted_pow)
+
+
+def disable() -> None:
+    """Stop counting and restore the uninstrumented functions. Counters
+    keep their values until reset_stats().
+    """
+
+    while _patched:
+        owner, attr, original = _patched.pop()
+        if original is None:
+            delattr(owner, attr)
+        else:
+            setattr(owner, attr, original)
+
+
+def enabled() -> bool:
+    """True if instrumentation is currently enabled."""
+    return bool(_patched)
+
+
+def stats() -> dict:
+    """Snapshot of the counters, as a dictionary of:
+
+    * ``"calls"``: call counts by function or "Class.method" name.
+    * ``"time_ns"``: nanoseconds spent in each function (only with timing).
+    * ``"conversions"``: ``"hsv_to_rgb"`` and ``"unpack"`` counts.
+    * ``"allocations"``: ``"CRGB"`` and ``"CHSV"`` instance counts.
+    * ``"pow"``: number of pow() calls.
+    """
+
+    return {
+        "calls": dict(_calls),
+        "time_ns": dict(_time),
+        "conversions": dict(_conversions),
+        "allocations": dict(_allocations),
+        "pow": _pow[0],
+    }
+
+
+def reset_stats() -> None:
+    """Zero all counters."""
+    for counter in (_calls, _time, _conversions, _allocations):
+        counter.clear()
+    _pow[0] = 0
+
+
+def _difference(after: dict, before: dict) -> dict:
+    result = {}
+    for key, value in after.items():
+        if isinstance(value, dict):
+            result[key] = _difference(value, before[key])
+        elif value != before.get(key, 0):
+            result[key] = value - before.get(key, 0)
+    return result
+
+
+class Collector:
+    """Context manager that collects stats for just the code inside its
+    ``with`` block (e.g. one frame), enabling instrumentation for the
+    block if it isn't already. Afterward, `stats` holds the counters
+    accumulated inside the block, in the same form as stats().
+
+    :param bool timing: accumulate time per function, as with enable().
+      Ignored if instrumentation was already enabled.
+    """
+
+    def __init__(self, timing: bool = False) -> None:
+        self.timing = timing
+        self.stats = None
+        self._before = None
+        self._owns = False
+
+    def __enter__(self) -> "Collector":
+        self._owns = not enabled()
+        if self._owns:
+            enable(self.timing)
+        self._before = stats()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        after = stats()
+        if self._owns:
+            disable()
+        result = _difference(after, self._before)
+        result["pow"] = after["pow"] - self._before["pow"]
+        for key in ("calls", "time_ns", "conversions", "allocations"):
+            result.setdefault(key, {})
+        self.stats = result
@@ -0,0 +1,280 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.layout`
+====================================================
+
+2D layouts for LED matrices and irregular installations: where each pixel
+of the strip sits in the X/Y plane. A layout is worked out once (from a
+serpentine or progressive matrix, a grid of tiled panels, or a list of
+coordinates from a CSV or JSON file) into flat lookup tables, so effects
+don't redo the ``y * width + x``/serpentine arithmetic for every pixel of
+every frame.
+
+A 2D palette effect precomputes a 'field' -- one palette position per
+strip pixel -- and renders it in strip order in one pass:
+
+.. code-block:: python
+
+      matrix = Layout.serpentine(64, 64)
+      diagonal = matrix.linear(1 / 64, 1 / 64)  # Palette position per pixel
+      while True:
+          matrix.render(palette, colors, diagonal, offset)
+          pixels[:] = colors
+          offset += 0.01
+
+Frames drawn in plain row-major X/Y order (a bitmap, a camera...) are
+copied into strip order with `Layout.reorder`, a precomputed permutation.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+import json
+from array import array
+from math import atan2, pi, sqrt
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+
+try:
+    from typing import Any, Callable, Optional
+except ImportError:
+    pass
+
+
+class Layout:
+    """Positions of a strip's pixels in 2D.
+
+    :param points: sequence of (x, y) coordinates, one per strip pixel in
+      strip order. Coordinates may be fractional or negative; for the grid
+      lookups (`xy`, `reorder`), they're rounded to the nearest cell of a
+      grid spanning them.
+
+    After creation:
+
+    * ``x``, ``y``: arrays of each strip pixel's coordinates.
+    * ``width``, ``height``: size of the grid.
+    * ``grid``: array, for each grid cell in row-major order, of the strip
+      pixel there, or -1 if none.
+    * ``cells``: array of each strip pixel's grid cell (row-major index).
+    """
+
+    def __init__(self, points: Any) -> None:
+        self.x = array("f", [point[0] for point in points])
+        self.y = array("f", [point[1] for point in points])
+        count = len(self.x)
+        self._min_x = min(self.x) if count else 0.0
+        self._min_y = min(self.y) if count else 0.0
+        columns = [int(x - self._min_x + 0.5) for x in self.x]
+        rows = [int(y - self._min_y + 0.5) for y in self.y]
+        self.width = max(columns) + 1 if count else 0
+        self.height = max(rows) + 1 if count else 0
+        self.cells = array("i", [row * self.width + col for col, row in zip(columns, rows)])
+        self.grid = array("i", [-1]) * (self.width * self.height)
+        for i, cell in enumerate(self.cells):
+            self.grid[cell] = i
+
+    def __len__(self) -> int:
+        """Number of pixels in the strip."""
+        return len(self.x)
+
+    @classmethod
+    def progressive(cls, width: int, height: int) -> "Layout":
+        """Matrix wired row by row, every row running left to right."""
+        return cls([(i % width, i // width) for i in range(width * height)])
+
+    @classmethod
+    def serpentine(cls, width: int, height: int, vertical: bool = False) -> "Layout":
+        """Matrix wired in a zig-zag: the first row runs left to right, the
+        next right to left and so on (or, if 'vertical', the same with
+        columns, the first running top to bottom).
+        """
+        return cls(_serpentine(width, height, vertical))
+
+    @classmethod
+    def tiled(  # noqa: PLR0913, PLR0917
+        cls,
+        panel_width: int,
+        panel_height: int,
+        panels_across: int,
+        panels_down: int,
+        serpentine: bool = True,
+        panel_serpentine: bool = True,
+    ) -> "Layout":
+        """Grid of identical matrix panels chained together: panels are
+        wired along each row of panels, left to right, then on to the next
+        row -- or, with 'panel_serpentine', alternating direction each
+        row of panels. Within a panel, pixels are wired as with
+        `serpentine` (or `progressive`, if 'serpentine' is False).
+        """
+        if serpentine:
+            panel = _serpentine(panel_width, panel_height, False)
+        else:
+            panel = [(i % panel_width, i // panel_width) for i in range(panel_width * panel_height)]
+        points = []
+        for row in range(panels_down):
+            for i in range(panels_across):
+                col = panels_across - 1 - i if panel_serpentine and row & 1 else i
+                left = col * panel_width
+                top = row * panel_height
+                points.extend((left + x, top + y) for x, y in panel)
+        return cls(points)
+
+    @classmethod
+    def from_csv(cls, text: str) -> "Layout":
+        """Layout from CSV text with one pixel per line, in strip order:
+        ``x,y``, or ``index,x,y`` to give strip indices explicitly (lines
+        may then be in any order). Blank lines, ``#`` comments and a
+        non-numeric header line are skipped.
+        """
+        rows = []
+        for line in text.splitlines():
+            values = line.split("#")[0].strip()
+            if not values:
+                continue
+            try:
+                rows.append([float(value) for value in values.split(",")])
+            except ValueError:
+                if rows:
+                    raise
+                # Header line
+        return cls(_ordered(rows))
+
+    @classmethod
+    def from_json(cls, text: str) -> "Layout":
+        """Layout from JSON text: a list of pixels in strip order, each an
+        ``[x, y]`` pair or an object with "x" and "y" (and optionally
+        "index") keys. The list may also be the "points" member of an
+        object.
+        """
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = data["points"]
+        rows = []
+        for item in data:
+            if isinstance(item, dict):
+                if "index" in item:
+                    rows.append([item["index"], item["x"], item["y"]])
+                else:
+                    rows.append([item["x"], item["y"]])
+            else:
+                rows.append(item)
+        return cls(_ordered(rows))
+
+    def xy(self, x: int, y: int) -> int:
+        """Strip index of the pixel at grid column 'x', row 'y', or -1 if
+        there's none (or x, y is off the grid).
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.grid[y * self.width + x]
+        return -1
+
+    def field(self, func: Callable[[float, float], float]) -> Any:
+        """Precompute a field: ``func(x, y)`` for each strip pixel's
+        coordinates, in strip order. Fields are palette positions for
+        `render` (or palette_lookup_many()).
+        """
+        return array("f", [func(x, y) for x, y in zip(self.x, self.y)])
+
+    def linear(self, scale_x: float, scale_y: float = 0.0) -> Any:
+        """Field of palette positions changing linearly across the layout,
+        by 'scale_x' per unit of X and 'scale_y' per unit of Y.
+        """
+        min_x = self._min_x
+        min_y = self._min_y
+        return self.field(lambda x, y: (x - min_x) * scale_x + (y - min_y) * scale_y)
+
+    def radial(
+        self, center_x: Optional[float] = None, center_y: Optional[float] = None, scale: float = 0.1
+    ) -> Any:
+        """Field of palette positions increasing by 'scale' per unit of
+        distance from a center point (default is the grid's center).
+        """
+        center_x, center_y = self._center(center_x, center_y)
+        return self.field(lambda x, y: sqrt((x - center_x) ** 2 + (y - center_y) ** 2) * scale)
+
+    def angular(self, center_x: Optional[float] = None, center_y: Optional[float] = None) -> Any:
+        """Field of palette positions going once around the palette per
+        turn around a center point (default is the grid's center).
+        """
+        center_x, center_y = self._center(center_x, center_y)
+        return self.field(lambda x, y: atan2(y - center_y, x - center_x) / (2 * pi) + 0.5)
+
+    def _center(self, center_x: Optional[float], center_y: Optional[float]) -> tuple:
+        if center_x is None:
+            center_x = self._min_x + (self.width - 1) / 2
+        if center_y is None:
+            center_y = self._min_y + (self.height - 1) / 2
+        return center_x, center_y
+
+    def render(  # noqa: PLR0913, PLR0917
+        self,
+        palette: Any,
+        out: Any,
+        field: Any,
+        offset: float = 0.0,
+        gamma_value: Any = None,
+        brightness: Any = None,
+    ) -> Any:
+        """Render a palette through a precomputed field, in strip order, in
+        one pass: palette_lookup_many() with the field as positions. 'out'
+        is as for palette_lookup_many() (packed integers, or R,G,B bytes).
+
+        :returns: 'out'.
+        """
+        return fancy.palette_lookup_many(
+            palette,
+            out,
+            offset,
+            positions=field,
+            gamma_value=gamma_value,
+            brightness=brightness,
+        )
+
+    def reorder(self, src: Any, dst: Any, bpp: int = 3) -> Any:
+        """Copy a frame in row-major grid order (``width`` * ``height``
+        pixels, top row first) into strip order, using the precomputed
+        permutation. Frames are sequences of packed integers (or colors),
+        or bytes-like with 'bpp' bytes per pixel.
+
+        :returns: 'dst'.
+        """
+        if isinstance(dst, (bytearray, memoryview)):
+            for i, cell in enumerate(self.cells):
+                j = cell * bpp
+                dst[i * bpp : i * bpp + bpp] = src[j : j + bpp]
+        else:
+            for i, cell in enumerate(self.cells):
+                dst[i] = src[cell]
+        return dst
+
+
+def _serpentine(width: int, height: int, vertical: bool) -> list:
+    points = []
+    for i in range(width * height):
+        if vertical:
+            x, y = divmod(i, height)
+            if x & 1:
+                y = height - 1 - y
+        else:
+            y, x = divmod(i, width)
+            if y & 1:
+                x = width - 1 - x
+        points.append((x, y))
+    return points
+
+
+def _ordered(rows: list) -> list:
+    """(x, y) points in strip order, from rows of x, y or index, x, y."""
+    if rows and len(rows[0]) > 2:
+        points = [None] * len(rows)
+        for index, x, y in rows:
+            points[int(index)] = (x, y)
+        if None in points:
+            raise ValueError("pixel indices must run from 0 to count - 1")
+        return points
+    return [(row[0], row[1]) for row in rows]
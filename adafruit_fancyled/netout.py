@@ -0,0 +1,409 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.netout`
+====================================================
+
+Network outputs for driving remote pixel controllers from a host
+computer: E1.31 (sACN) and Art-Net, which carry pixels as DMX universes
+over UDP, and Open Pixel Control (OPC) over TCP.
+
+Each output is made for a fixed number of pixels. All of its packets are
+built once, headers and all, and each frame only copies the pixel bytes
+into the packets' payloads (through memoryview slices) and bumps the
+sequence numbers before sending every packet back-to-back over one
+socket, which stays open:
+
+.. code-block:: python
+
+      out = E131Output(num_leds, "192.168.1.50")
+      while True:
+          fancy.palette_lookup_many(palette, frame, offset)  # bytearray
+          out.send(frame)
+
+Frames are bytes-like (bytearray, memoryview, bytes) of R,G,B bytes,
+three per pixel, sent as-is; or anything pack_into() accepts (a
+`PixelFrame`, list of colors...), which is encoded in the output's byte
+'order' first. Outputs also have an async ``write()`` method, which sends
+from a worker thread, so they can be the sink of a
+`adafruit_fancyled.pipeline.RenderPipeline` without blocking rendering.
+
+Each output's `stats` reports packets per second and per-frame send
+time. For testing, pass a 'host' of ``"127.0.0.1"`` and the port of a
+local socket receiving the packets.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+import asyncio
+import os
+import socket
+import time
+from array import array
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+from adafruit_fancyled.scheduler import _percentiles
+
+try:
+    from typing import Any, Optional
+except ImportError:
+    pass
+
+E131_PORT = 5568  # Standard E1.31 (sACN) UDP port
+ARTNET_PORT = 6454  # Standard Art-Net UDP port
+OPC_PORT = 7890  # Usual Open Pixel Control TCP port
+
+DMX_PIXELS = 170  # RGB pixels that fit in one 512-slot DMX universe
+
+_E131_HEADER = 126  # Bytes before the DMX slots of an E1.31 data packet
+_ARTNET_HEADER = 18  # Bytes before the DMX slots of an ArtDmx packet
+_OPC_HEADER = 4  # Bytes before the pixel data of an OPC message
+
+
+class _Output:
+    """Common parts of the network outputs: a set of prebuilt packets,
+    each with a payload view into which a slice of the frame is copied.
+    Subclasses add packets with _add_packet() and send them in _send().
+    """
+
+    def __init__(self, length: int, order: str, history: int) -> None:
+        self.length = length
+        self.order = order
+        self._rgb = bytearray(len(order) * length)  # For non-bytes frames
+        self._packets = []  # (packet bytearray, destination address)
+        self._payloads = []  # (payload memoryview, frame start, frame stop)
+        self._send_times = array("f", bytearray(4 * max(history, 1)))
+        self.reset_stats()
+
+    def _add_packet(self, packet: bytearray, header: int, start: int, stop: int, address: Any):
+        """Add a prebuilt packet whose payload (after 'header' bytes)
+        carries frame bytes 'start' to 'stop'.
+        """
+        self._packets.append((packet, address))
+        self._payloads.append((memoryview(packet)[header : header + stop - start], start, stop))
+
+    def send(self, frame: Any) -> None:
+        """Send one frame: a bytes-like object of (at least) length times
+        len(order) bytes, or anything pack_into() accepts.
+        """
+        if not isinstance(frame, (bytes, bytearray, memoryview)):
+            frame = fancy.pack_into(frame, self._rgb, self.order)
+        frame = memoryview(frame)
+        start_time = time.monotonic()
+        for payload, start, stop in self._payloads:
+            payload[:] = frame[start:stop]
+        self._send()
+        now = time.monotonic()
+        times = self._send_times
+        times[self.frames % len(times)] = now - start_time
+        if not self.frames:
+            self._first_frame = start_time
+        self._last_frame = now
+        self.frames += 1
+        self.packets += len(self._packets)
+
+    async def write(self, frame: Any) -> None:
+        """send() as a coroutine, for use as a RenderPipeline sink. The
+        (blocking) send runs in the event loop's default executor, so the
+        loop -- and rendering of the next frame -- carries on meanwhile.
+        Await each write before the next; they share the packet buffers.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.send, frame)
+
+    def _send(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Close the output's socket."""
+        raise NotImplementedError
+
+    def __enter__(self) -> "_Output":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def reset_stats(self) -> None:
+        """Zero the frame and packet counts and send time history."""
+        self.frames = 0  # Frames sent
+        self.packets = 0  # Packets (or OPC messages) sent
+        self._first_frame = self._last_frame = 0.0
+
+    @property
+    def stats(self) -> dict:
+        """Statistics since the output was created or `reset_stats`, as a
+        dictionary of:
+
+        * ``"frames"``, ``"packets"``: number sent.
+        * ``"packets_per_second"``: packet rate from the start of the first
+          frame sent to the end of the last.
+        * ``"send_ms"``: dictionary of ``"p50"``, ``"p90"``, ``"p99"`` and
+          ``"max"`` time taken to send a frame, in milliseconds, over recent
+          frames.
+        """
+        span = self._last_frame - self._first_frame
+        return {
+            "frames": self.frames,
+            "packets": self.packets,
+            "packets_per_second": self.packets / span if span > 0 else 0.0,
+            "send_ms": _percentiles(self._send_times, self.frames),
+        }
+
+
+class _DMXOutput(_Output):
+    """Output splitting a frame into DMX universes, one UDP packet each."""
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        length: int,
+        universe: int,
+        pixels_per_universe: int,
+        order: str,
+        history: int,
+        sock: Optional[Any],
+    ) -> None:
+        super().__init__(length, order, history)
+        bpp = len(order)
+        if not 0 < pixels_per_universe * bpp <= 512:
+            raise ValueError("pixels_per_universe doesn't fit in a DMX universe")
+        self.universe = universe
+        self._sequence = 0
+        if sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._setup_socket(sock)
+        self.sock = sock
+        span = pixels_per_universe * bpp
+        total = length * bpp
+        for index, start in enumerate(range(0, total, span)):
+            self._add_universe(universe + index, start, min(start + span, total))
+
+    def _setup_socket(self, sock: Any) -> None:
+        pass
+
+    def _add_universe(self, universe: int, start: int, stop: int) -> None:
+        raise NotImplementedError
+
+    def _set_sequence(self, packet: bytearray, sequence: int) -> None:
+        raise NotImplementedError
+
+    def _send(self) -> None:
+        # Sequence numbers skip 0, which means 'not sequenced' to Art-Net
+        self._sequence = self._sequence % 255 + 1
+        sequence = self._sequence
+        set_sequence = self._set_sequence
+        sendto = self.sock.sendto
+        for packet, address in self._packets:
+            set_sequence(packet, sequence)
+            sendto(packet, address)
+
+    def close(self) -> None:
+        """Close the output's socket."""
+        self.sock.close()
+
+
+class E131Output(_DMXOutput):
+    """E1.31 (streaming ACN, "sACN") output.
+
+    :param int length: number of pixels per frame.
+    :param str host: controller address to send to, or None (default) to
+      multicast each universe to its standard group (239.255.x.y).
+    :param int universe: first universe (default 1); a frame too big for
+      one universe continues on the following ones.
+    :param int pixels_per_universe: pixels per universe (default 170, the
+      most 3-byte pixels that fit in 512 DMX slots).
+    :param str order: byte order for frames that aren't already bytes,
+      as with pack_into() (default "RGB").
+    :param int port: UDP port (default 5568).
+    :param str source_name: source name put in every packet.
+    :param int priority: E1.31 priority, 0 to 200 (default 100).
+    :param bytes cid: 16-byte sender ID (default is random).
+    :param int history: frames kept for the send time percentiles.
+    :param sock: optional UDP socket to send with, instead of a new one.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        length: int,
+        host: Optional[str] = None,
+        universe: int = 1,
+        pixels_per_universe: int = DMX_PIXELS,
+        order: str = "RGB",
+        *,
+        port: int = E131_PORT,
+        source_name: str = "FancyLED",
+        priority: int = 100,
+        cid: Optional[bytes] = None,
+        history: int = 120,
+        sock: Optional[Any] = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self._source_name = source_name.encode("utf-8")[:63]
+        self._priority = priority
+        self._cid = bytes(os.urandom(16) if cid is None else cid)
+        super().__init__(length, universe, pixels_per_universe, order, history, sock)
+
+    def _add_universe(self, universe: int, start: int, stop: int) -> None:
+        slots = stop - start
+        packet = bytearray(_E131_HEADER + slots)
+        size = len(packet)
+        # Root layer
+        packet[0:2] = b"\x00\x10"  # Preamble size
+        packet[4:16] = b"ASC-E1.17\x00\x00\x00"  # ACN packet identifier
+        _put16(packet, 16, 0x7000 | (size - 16))  # Flags and length
+        packet[18:22] = b"\x00\x00\x00\x04"  # VECTOR_ROOT_E131_DATA
+        packet[22:38] = self._cid
+        # Framing layer
+        _put16(packet, 38, 0x7000 | (size - 38))
+        packet[40:44] = b"\x00\x00\x00\x02"  # VECTOR_E131_DATA_PACKET
+        packet[44 : 44 + len(self._source_name)] = self._source_name
+        packet[108] = self._priority
+        _put16(packet, 113, universe)
+        # DMP layer
+        _put16(packet, 115, 0x7000 | (size - 115))
+        packet[117] = 0x02  # VECTOR_DMP_SET_PROPERTY
+        packet[118] = 0xA1  # Address type and data type
+        _put16(packet, 121, 1)  # Address increment
+        _put16(packet, 123, slots + 1)  # Property values, incl. start code
+        # Byte 125 is the DMX start code, 0
+        host = self.host
+        if host is None:
+            host = f"239.255.{universe >> 8}.{universe & 0xFF}"
+        self._add_packet(packet, _E131_HEADER, start, stop, (host, self.port))
+
+    def _set_sequence(self, packet: bytearray, sequence: int) -> None:
+        packet[111] = sequence
+
+
+class ArtNetOutput(_DMXOutput):
+    """Art-Net (ArtDmx) output.
+
+    :param int length: number of pixels per frame.
+    :param str host: controller address to send to (default is the
+      broadcast address).
+    :param int universe: first 15-bit port-address (net, sub-net and
+      universe, default 0); a frame too big for one universe continues on
+      the following ones.
+    :param int pixels_per_universe: pixels per universe (default 170).
+    :param str order: byte order for frames that aren't already bytes,
+      as with pack_into() (default "RGB").
+    :param int port: UDP port (default 6454).
+    :param int history: frames kept for the send time percentiles.
+    :param sock: optional UDP socket to send with, instead of a new one.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        length: int,
+        host: str = "255.255.255.255",
+        universe: int = 0,
+        pixels_per_universe: int = DMX_PIXELS,
+        order: str = "RGB",
+        *,
+        port: int = ARTNET_PORT,
+        history: int = 120,
+        sock: Optional[Any] = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        super().__init__(length, universe, pixels_per_universe, order, history, sock)
+
+    def _setup_socket(self, sock: Any) -> None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+    def _add_universe(self, universe: int, start: int, stop: int) -> None:
+        slots = stop - start
+        slots += slots & 1  # DMX length must be even, pad with a zero
+        packet = bytearray(_ARTNET_HEADER + slots)
+        packet[0:8] = b"Art-Net\x00"
+        packet[8:10] = b"\x00\x50"  # OpDmx, little-endian
+        packet[10:12] = b"\x00\x0e"  # Protocol version 14
+        packet[14] = universe & 0xFF  # Sub-net and universe
+        packet[15] = (universe >> 8) & 0x7F  # Net
+        _put16(packet, 16, slots)
+        self._add_packet(packet, _ARTNET_HEADER, start, stop, (self.host, self.port))
+
+    def _set_sequence(self, packet: bytearray, sequence: int) -> None:
+        packet[12] = sequence
+
+
+class OPCOutput(_Output):
+    """Open Pixel Control output, over TCP. The connection is made on the
+    first send, and remade on the next send if it's lost.
+
+    :param int length: number of pixels per frame.
+    :param str host: OPC server address (default "127.0.0.1").
+    :param int port: TCP port (default 7890).
+    :param int channel: OPC channel (default 0, meaning all channels);
+      with 'pixels_per_message', the first of consecutive channels.
+    :param int pixels_per_message: optional maximum pixels per message.
+      The frame is split across channels 'channel', 'channel' + 1...
+      All messages go out in a single send.
+    :param str order: byte order for frames that aren't already bytes,
+      as with pack_into() (default "RGB").
+    :param int history: frames kept for the send time percentiles.
+    :param sock: optional connected socket to send with.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        length: int,
+        host: str = "127.0.0.1",
+        port: int = OPC_PORT,
+        channel: int = 0,
+        pixels_per_message: Optional[int] = None,
+        *,
+        order: str = "RGB",
+        history: int = 120,
+        sock: Optional[Any] = None,
+    ) -> None:
+        super().__init__(length, order, history)
+        self.host = host
+        self.port = port
+        self.sock = sock
+        bpp = len(order)
+        total = length * bpp
+        span = (pixels_per_message or length or 1) * bpp
+        if span > 0xFFFF:
+            raise ValueError("OPC messages hold at most 65535 bytes")
+        starts = range(0, total, span)
+        # All the messages live in one buffer, so a frame is one sendall()
+        self._message = bytearray(_OPC_HEADER * len(starts) + total)
+        at = 0
+        for index, start in enumerate(starts):
+            stop = min(start + span, total)
+            self._message[at] = channel + index
+            self._message[at + 1] = 0  # Command 0, set pixel colors
+            _put16(self._message, at + 2, stop - start)
+            self._payloads.append(
+                (memoryview(self._message)[at + 4 : at + 4 + stop - start], start, stop)
+            )
+            self._packets.append((None, None))
+            at += _OPC_HEADER + stop - start
+
+    def _send(self) -> None:
+        if self.sock is None:
+            self.sock = socket.create_connection((self.host, self.port))
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            self.sock.sendall(self._message)
+        except OSError:
+            self.close()  # Reconnect next frame
+            raise
+
+    def close(self) -> None:
+        """Close the connection to the OPC server."""
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+
+def _put16(buf: bytearray, index: int, value: int) -> None:
+    """Store a big-endian 16-bit value."""
+    buf[index] = (value >> 8) & 0xFF
+    buf[index + 1] = value & 0xFF
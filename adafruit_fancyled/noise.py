@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.noise`
+====================================================
+
+Perlin noise in integer math, in the style of FastLED's inoise8() and
+inoise16(), for fire, plasma, lava and other organic-looking effects.
+There's no floating-point math, so it's usable on boards without a
+floating-point unit.
+
+Coordinates are fixed-point integers: inoise16() takes 16.16 (65536 is
+one noise cell), inoise8() takes 8.8 (256 is one cell), as in FastLED.
+Results are close to FastLED's in character and range but not
+bit-identical. Moving smoothly through noise usually means stepping one
+coordinate (often 'z', for time) a little each frame.
+
+`noise_field` fills a whole 2D grid of 8-bit noise values at once, which
+palette_lookup_many() takes directly as palette positions:
+
+.. code-block:: python
+
+      field = bytearray(width * height)
+      while True:
+          noise_field(width, height, 0, 0, z, 4096, out=field)
+          fancy.palette_lookup_many(fire_palette, colors, positions=field)
+          z += 2048
+
+`adafruit_fancyled.vectorized.noise_field` is a NumPy version giving the
+same values, for large host-driven displays.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+try:
+    from typing import Any, Optional
+except ImportError:
+    pass
+
+# Ken Perlin's reference permutation, repeated so that indexes up to 511
+# need no masking
+# fmt: off
+_PERMUTATION = bytes((
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+    247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175,
+    74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+    60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+    65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+    200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64,
+    52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212,
+    207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213,
+    119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+    129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+    218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241,
+    81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+    184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+    222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+)) * 2
+# fmt: on
+
+_ONE = 0x10000  # One noise cell in 16.16 fixed point
+
+
+def _fade(t: int) -> int:
+    """3t^2 - 2t^3 ease curve, 16-bit fraction in and out."""
+    return (((t * t) >> 16) * (3 * _ONE - 2 * t)) >> 16
+
+
+def _grad3(hash_: int, x: int, y: int, z: int) -> int:
+    """Dot product of fraction x, y, z with one of Perlin's 12 gradients."""
+    hash_ &= 15
+    u = x if hash_ < 8 else y
+    if hash_ < 4:
+        v = y
+    elif hash_ in {12, 14}:
+        v = x
+    else:
+        v = z
+    return (-u if hash_ & 1 else u) + (-v if hash_ & 2 else v)
+
+
+def _grad1(hash_: int, x: int) -> int:
+    """Fraction x times one of 8 1D gradients (-4 to 4, not 0), quartered."""
+    grad = 1 + (hash_ & 3)
+    return (-grad * x if hash_ & 4 else grad * x) >> 2
+
+
+def _lerp(a: int, b: int, t: int) -> int:
+    return a + (((b - a) * t) >> 16)
+
+
+def _noise3(x: int, y: int, z: int) -> int:
+    """Raw 3D noise at 16.16 coordinates, roughly -65536 to 65536."""
+    perm = _PERMUTATION
+    cx = (x >> 16) & 0xFF
+    cy = (y >> 16) & 0xFF
+    cz = (z >> 16) & 0xFF
+    x &= 0xFFFF
+    y &= 0xFFFF
+    z &= 0xFFFF
+    u = _fade(x)
+    v = _fade(y)
+    w = _fade(z)
+    a = perm[cx] + cy
+    aa = perm[a] + cz
+    ab = perm[a + 1] + cz
+    b = perm[cx + 1] + cy
+    ba = perm[b] + cz
+    bb = perm[b + 1] + cz
+    x1 = x - _ONE
+    y1 = y - _ONE
+    z1 = z - _ONE
+    return _lerp(
+        _lerp(
+            _lerp(_grad3(perm[aa], x, y, z), _grad3(perm[ba], x1, y, z), u),
+            _lerp(_grad3(perm[ab], x, y1, z), _grad3(perm[bb], x1, y1, z), u),
+            v,
+        ),
+        _lerp(
+            _lerp(_grad3(perm[aa + 1], x, y, z1), _grad3(perm[ba + 1], x1, y, z1), u),
+            _lerp(_grad3(perm[ab + 1], x, y1, z1), _grad3(perm[bb + 1], x1, y1, z1), u),
+            v,
+        ),
+        w,
+    )
+
+
+def _noise2(x: int, y: int) -> int:
+    """Raw 2D noise at 16.16 coordinates, roughly -65536 to 65536."""
+    perm = _PERMUTATION
+    cx = (x >> 16) & 0xFF
+    cy = (y >> 16) & 0xFF
+    x &= 0xFFFF
+    y &= 0xFFFF
+    u = _fade(x)
+    v = _fade(y)
+    a = perm[cx] + cy
+    b = perm[cx + 1] + cy
+    x1 = x - _ONE
+    y1 = y - _ONE
+    return _lerp(
+        _lerp(_grad3(perm[a], x, y, 0), _grad3(perm[b], x1, y, 0), u),
+        _lerp(_grad3(perm[a + 1], x, y1, 0), _grad3(perm[b + 1], x1, y1, 0), u),
+        v,
+    )
+
+
+def _noise1(x: int) -> int:
+    """Raw 1D noise at a 16.16 coordinate, roughly -65536 to 65536."""
+    perm = _PERMUTATION
+    cx = (x >> 16) & 0xFF
+    x &= 0xFFFF
+    return _lerp(_grad1(perm[cx], x), _grad1(perm[cx + 1], x - _ONE), _fade(x))
+
+
+def _scale16(raw: int) -> int:
+    """Raw noise to 0-65535. Like FastLED, the raw range is stretched so
+    that typical values use most of the output range, clipping the rare
+    extremes.
+    """
+    value = 32768 + ((raw * 3) >> 2)
+    return 0 if value < 0 else 65535 if value > 65535 else value
+
+
+def inoise16(x: int, y: Optional[int] = None, z: Optional[int] = None) -> int:
+    """1D, 2D or 3D Perlin noise, like FastLED's inoise16().
+
+    ACCEPTS: x, and optionally y and z, coordinates in 16.16 fixed point
+    RETURNS: noise value 0 to 65535
+    """
+    if y is None:
+        return _scale16(_noise1(x))
+    if z is None:
+        return _scale16(_noise2(x, y))
+    return _scale16(_noise3(x, y, z))
+
+
+def inoise8(x: int, y: Optional[int] = None, z: Optional[int] = None) -> int:
+    """1D, 2D or 3D Perlin noise, like FastLED's inoise8().
+
+    ACCEPTS: x, and optionally y and z, coordinates in 8.8 fixed point
+    RETURNS: noise value 0 to 255
+    """
+    return inoise16(x << 8, None if y is None else y << 8, None if z is None else z << 8) >> 8
+
+
+def noise_field(  # noqa: PLR0913, PLR0917
+    width: int,
+    height: int,
+    x: int = 0,
+    y: int = 0,
+    z: Optional[int] = None,
+    scale: int = 4096,
+    out: Optional[Any] = None,
+) -> Any:
+    """Fill a 2D grid with 8-bit noise values, as inoise16(...) >> 8 for
+    each pixel, faster than calling it per pixel (the per-column and
+    per-row parts of the math are only done once per column and row, and
+    for 2D noise the rest is inlined).
+
+    :param int width: columns in the grid.
+    :param int height: rows in the grid.
+    :param int x: 16.16 noise X coordinate of the first column.
+    :param int y: 16.16 noise Y coordinate of the first row.
+    :param int z: optional 16.16 noise Z coordinate (e.g. time) for 3D
+      noise; 2D noise if omitted.
+    :param int scale: noise coordinate step (16.16) from one pixel to the
+      next; smaller values give larger, smoother features.
+    :param out: optional bytearray (or other mutable sequence) of at
+      least width * height values, to fill in row-major order. If
+      omitted, a new bytearray is allocated.
+    :returns: 'out', or the new bytearray.
+    """
+    if out is None:
+        out = bytearray(width * height)
+    # Cell and fraction of each column and row, computed once
+    columns = [x + i * scale for i in range(width)]
+    col_cells = [(cx >> 16) & 0xFF for cx in columns]
+    col_fracs = [cx & 0xFFFF for cx in columns]
+    col_fades = [_fade(f) for f in col_fracs]
+    perm = _PERMUTATION
+    index = 0
+    for row in range(height):
+        ry = y + row * scale
+        cy = (ry >> 16) & 0xFF
+        fy = ry & 0xFFFF
+        v = _fade(fy)
+        fy1 = fy - _ONE
+        for col in range(width):
+            cx = col_cells[col]
+            fx = col_fracs[col]
+            if z is None:
+                a = perm[cx] + cy
+                b = perm[cx + 1] + cy
+                fx1 = fx - _ONE
+                u = col_fades[col]
+                raw = _lerp(
+                    _lerp(_grad3(perm[a], fx, fy, 0), _grad3(perm[b], fx1, fy, 0), u),
+                    _lerp(_grad3(perm[a + 1], fx, fy1, 0), _grad3(perm[b + 1], fx1, fy1, 0), u),
+                    v,
+                )
+            else:
+                raw = _noise3((cx << 16) | fx, ry, z)
+            out[index] = _scale16(raw) >> 8
+            index += 1
+    return out
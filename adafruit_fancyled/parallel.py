@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.parallel`
+====================================================
+
+Multi-process palette rendering for very large displays (tens or
+hundreds of thousands of pixels) driven from a multi-core host computer.
+Each frame is split into segments that worker processes render with
+palette_lookup_many(), straight into one shared-memory R,G,B byte buffer,
+so frames are never pickled between processes; only a few numbers per
+segment are sent each frame. The result is byte-for-byte what a single
+palette_lookup_many() call would produce.
+
+.. code-block:: python
+
+      with ParallelRenderer(palette, num_leds, brightness=0.25) as renderer:
+          while True:
+              frame = renderer.render(offset)  # memoryview of R,G,B bytes
+              send(frame)
+              offset += 0.01
+
+Host-only (this uses multiprocessing.shared_memory, which CircuitPython
+doesn't have); the main FancyLED module never imports this one. On
+platforms that start worker processes with "spawn" (Windows, macOS),
+create the renderer under an ``if __name__ == "__main__":`` guard.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+
+try:
+    from typing import Any, Optional
+except ImportError:
+    pass
+
+# Per-process state of a worker, set up once by _init_worker()
+_worker = {}
+
+
+def _init_worker(  # noqa: PLR0913, PLR0917
+    palette: Any,
+    length: int,
+    frame_name: str,
+    positions_name: Optional[str],
+    positions_format: str,
+    options: dict,
+):
+    """Attach a worker process to the shared buffers. The palette arrives
+    here once per worker (pickled with the pool's initializer arguments)
+    rather than with every frame.
+    """
+    frame = shared_memory.SharedMemory(name=frame_name)
+    _worker["frame"] = frame  # Keep a reference so the mapping stays open
+    # Shared memory may be rounded up to a whole page, so slice the views
+    # to the frame's length; the default step depends on it.
+    _worker["out"] = frame.buf[: 3 * length]
+    _worker["positions"] = None
+    if positions_name is not None:
+        positions = shared_memory.SharedMemory(name=positions_name)
+        _worker["positions_shm"] = positions
+        # "B" for 8-bit positions, kept as raw bytes; "d" for floats
+        size = array(positions_format).itemsize
+        _worker["positions"] = positions.buf[: size * length].cast(positions_format)
+    _worker["palette"] = palette
+    _worker["options"] = options
+
+
+def _render_segment(offset: float, step: Optional[float], start: int, stop: int) -> None:
+    fancy.palette_lookup_many(
+        _worker["palette"],
+        _worker["out"],
+        offset,
+        step,
+        _worker["positions"],
+        start=start,
+        stop=stop,
+        **_worker["options"],
+    )
+
+
+class ParallelRenderer:
+    """Render palette frames across a pool of worker processes.
+
+    :param palette: `Palette` (or list of colors, compiled into one) to
+      render from. It's sent to each worker once, so later changes to it
+      aren't seen by the workers; make a new renderer instead.
+    :param int length: number of pixels per frame.
+    :param int workers: number of worker processes (default is one per
+      CPU core).
+    :param int segments: number of pieces each frame is split into
+      (default is the number of workers).
+    :param positions: optional palette position per pixel, as with
+      palette_lookup_many() (e.g. from a 2D layout, or 8-bit positions
+      such as a noise field), copied into shared memory once.
+    :param gamma_value: optional gamma, as with palette_lookup_many().
+    :param brightness: optional brightness, as with palette_lookup_many().
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        palette: Any,
+        length: int,
+        workers: Optional[int] = None,
+        segments: Optional[int] = None,
+        positions: Optional[Any] = None,
+        gamma_value: Any = None,
+        brightness: Any = None,
+    ) -> None:
+        if not isinstance(palette, fancy.Palette):
+            palette = fancy.Palette(palette)
+        positions_format = "d"
+        if positions is not None:
+            # 8-bit positions (e.g. a noise field) stay 8-bit, so workers
+            # read them the same way palette_lookup_many() would
+            values = fancy._byte_values(positions, signed=True)
+            if values is None:
+                values = array("d", positions)
+            else:
+                values = array("B", bytes(values))
+                positions_format = "B"
+            if len(values) != length:
+                raise ValueError("need one position per pixel")
+        workers = workers or os.cpu_count() or 1
+        self.length = length
+        self._segments = _split(length, segments or workers)
+
+        self._frame_shm = shared_memory.SharedMemory(create=True, size=max(3 * length, 1))
+        self.frame = self._frame_shm.buf[: 3 * length]
+        self._positions_shm = None
+        positions_name = None
+        if positions is not None:
+            self._positions_shm = shared_memory.SharedMemory(
+                create=True, size=max(len(values) * values.itemsize, 1)
+            )
+            self._positions_shm.buf[: len(values) * values.itemsize] = values.tobytes()
+            positions_name = self._positions_shm.name
+        options = {"gamma_value": gamma_value, "brightness": brightness}
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(
+                palette,
+                length,
+                self._frame_shm.name,
+                positions_name,
+                positions_format,
+                options,
+            ),
+        )
+
+    def render(self, offset: float = 0.0, step: Optional[float] = None) -> memoryview:
+        """Render one frame, as palette_lookup_many(palette, frame, offset,
+        step...) would, and wait for it to finish.
+
+        :returns: memoryview of the R,G,B bytes (three per pixel) in shared
+          memory, reused (overwritten) by the next call -- copy it if it
+          must be kept.
+        """
+        futures = [
+            self._pool.submit(_render_segment, offset, step, start, stop)
+            for start, stop in self._segments
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()  # Re-raise any exception from a worker
+        return self.frame
+
+    def close(self) -> None:
+        """Shut down the worker processes and free the shared memory.
+
+        Views of `frame` (e.g. slices of what `render` returned) should be
+        released first. If any are still held, the shared memory is still
+        unlinked, but stays mapped until they're garbage-collected.
+        """
+        if self._pool is None:
+            return
+        self._pool.shutdown()
+        self._pool = None
+        try:
+            self.frame.release()
+        except BufferError:
+            pass  # Caller still holds views derived from the frame
+        for shm in (self._frame_shm, self._positions_shm):
+            if shm is not None:
+                try:
+                    shm.close()
+                except BufferError:
+                    pass  # Mapping is freed when the last view goes away
+                shm.unlink()
+
+    def __enter__(self) -> "ParallelRenderer":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _split(length: int, count: int) -> list:
+    """Split range(length) into 'count' (or fewer) near-equal (start, stop)
+    pieces.
+    """
+    count = max(1, min(count, length))
+    return [(length * i // count, length * (i + 1) // count) for i in range(count)]
@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.pipeline`
+====================================================
+
+Double-buffered asyncio render/output pipeline, for installations where
+sending a frame (to a strip driver, over the network...) takes long
+enough to matter. One frame is rendered into one buffer while the
+previous frame is sent from the other, then the buffers swap, so a
+frame's render and output times overlap instead of adding up.
+
+Rendering is an async function (usually calling FancyLED's bulk
+functions such as palette_lookup_many() or pack_into()) that fills a
+buffer; the output is any object with an async ``write(buffer)`` method:
+
+.. code-block:: python
+
+      async def render(buf, frame):
+          fancy.palette_lookup_many(palette, buf, frame * 0.01, brightness=0.25)
+
+      pipeline = RenderPipeline(render, sink, 3 * num_leds)
+      asyncio.run(pipeline.run())
+
+If the output can't keep up, rendering waits for a free buffer
+(backpressure); the time spent waiting either way is reported by
+`RenderPipeline.stats`, along with render, output and end-to-end
+latencies. `MemorySink` is an in-memory output for tests and dry runs.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+import asyncio
+import time
+from array import array
+
+from adafruit_fancyled.scheduler import _percentiles
+
+try:
+    from typing import Any, Callable, Optional, Union
+except ImportError:
+    pass
+
+
+class MemorySink:
+    """Output that keeps copies of the frames written to it, for testing.
+
+    :param float delay: seconds each write takes (simulated with
+      asyncio.sleep), to stand in for a slow device.
+    :param int keep: only keep this many most-recent frames (default is
+      all of them).
+    """
+
+    def __init__(self, delay: float = 0.0, keep: Optional[int] = None) -> None:
+        self.delay = delay
+        self.keep = keep
+        self.frames = []  # bytes copies of the frames written, oldest first
+        self.writes = 0  # Number of write() calls
+
+    async def write(self, buf: Any) -> None:
+        """Record a copy of the buffer."""
+        self.writes += 1
+        self.frames.append(bytes(buf))
+        if self.keep is not None and len(self.frames) > self.keep:
+            self.frames.pop(0)
+        await asyncio.sleep(self.delay)
+
+
+class RenderPipeline:
+    """Render frames into one buffer while another is being output.
+
+    :param render: async function called as ``await render(buffer, frame)``
+      to fill 'buffer' with frame number 'frame' (counting from 0). If it
+      returns False, the pipeline stops after outputting that frame.
+    :param sink: output, an object with an async ``write(buffer)`` method.
+    :param buffers: number of bytes for each of two new bytearray buffers,
+      or a sequence of two or more buffers of any kind (e.g. ``array('I')``
+      or `PixelFrame`) that 'render' and 'sink' both understand.
+    :param float fps: optional maximum frame rate to render at.
+    :param clock: function returning seconds as a float, default is
+      time.monotonic.
+    :param int history: number of recent frames kept for the latency
+      percentiles in `stats`.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        render: Callable[[Any, int], Any],
+        sink: Any,
+        buffers: Union[int, list],
+        fps: Optional[float] = None,
+        clock: Optional[Callable[[], float]] = None,
+        history: int = 120,
+    ) -> None:
+        if isinstance(buffers, int):
+            buffers = [bytearray(buffers), bytearray(buffers)]
+        if len(buffers) < 2:
+            raise ValueError("need at least two buffers")
+        self.render = render
+        self.sink = sink
+        self.buffers = list(buffers)
+        self.period = 1.0 / fps if fps else 0.0
+        self.clock = clock or time.monotonic
+        self._free = []  # Buffers ready to render into
+        self._ready = []  # (buffer, frame number, render start) to output
+        # Created by run(), so that they belong to the loop it runs in
+        self._free_event = None
+        self._ready_event = None
+        self._running = False
+        self._rendering = False
+        # Ring buffers of recent times (seconds), one per measurement
+        self._times = {
+            name: array("f", bytearray(4 * max(history, 1)))
+            for name in ("render", "output", "latency")
+        }
+        self.reset_stats()
+
+    async def run(self, frames: Optional[int] = None) -> None:
+        """Render and output frames until `stop` is called, 'render'
+        returns False or (if given) 'frames' frames have been output.
+        Frames already rendered are output before this returns.
+        """
+        self._free = list(self.buffers)
+        self._ready = []
+        self._free_event = asyncio.Event()
+        self._ready_event = asyncio.Event()
+        self._running = True
+        self._rendering = True
+        render_task = asyncio.ensure_future(self._render_loop(frames))
+        try:
+            await self._output_loop()
+        finally:
+            # Also reached if the sink raises: don't leave rendering running
+            self._running = False
+            if not render_task.done():
+                render_task.cancel()
+            try:
+                await render_task  # Re-raises any exception from 'render'
+            except asyncio.CancelledError:
+                pass
+
+    def stop(self) -> None:
+        """Stop rendering new frames; `run` returns once the frames already
+        rendered have been output.
+        """
+        self._running = False
+
+    async def _render_loop(self, frames: Optional[int]) -> None:
+        clock = self.clock
+        number = 0
+        deadline = clock()
+        try:
+            while self._running and (frames is None or number < frames):
+                while not self._free:
+                    # Backpressure: every buffer is rendered or being sent
+                    self._free_event.clear()
+                    start = clock()
+                    await self._free_event.wait()
+                    self.render_wait += clock() - start
+                    self.render_waits += 1
+                if self.period:
+                    now = clock()
+                    if now < deadline:
+                        await asyncio.sleep(deadline - now)
+                    deadline = max(deadline + self.period, now)
+                if not self._running:
+                    break  # stop() was called while waiting
+                buf = self._free.pop(0)
+                start = clock()
+                result = await self.render(buf, number)
+                self._record("render", self.rendered, clock() - start)
+                self.rendered += 1
+                number += 1
+                self._ready.append((buf, number - 1, start))
+                self._ready_event.set()
+                if result is False:
+                    break
+        finally:
+            self._rendering = False
+            self._ready_event.set()
+
+    async def _output_loop(self) -> None:
+        clock = self.clock
+        while True:
+            while not self._ready:
+                if not self._rendering:
+                    return
+                # Output is starved, waiting for a frame to be rendered
+                self._ready_event.clear()
+                start = clock()
+                await self._ready_event.wait()
+                self.output_wait += clock() - start
+            buf, number, rendered_at = self._ready.pop(0)
+            start = clock()
+            await self.sink.write(buf)
+            now = clock()
+            self._record("output", self.output, now - start)
+            self._record("latency", self.output, now - rendered_at)
+            self.output += 1
+            self.last_frame = number
+            self._free.append(buf)
+            self._free_event.set()
+
+    def _record(self, name: str, index: int, value: float) -> None:
+        times = self._times[name]
+        times[index % len(times)] = value
+
+    def reset_stats(self) -> None:
+        """Zero the frame counts, wait times and latency history."""
+        self.rendered = 0  # Frames rendered
+        self.output = 0  # Frames written to the sink
+        self.last_frame = -1  # Number of the last frame written
+        self.render_wait = 0.0  # Seconds rendering waited for a free buffer
+        self.render_waits = 0  # Number of times rendering had to wait
+        self.output_wait = 0.0  # Seconds the output waited for a frame
+
+    @property
+    def stats(self) -> dict:
+        """Statistics since the pipeline was created or `reset_stats`, as a
+        dictionary of:
+
+        * ``"rendered"``, ``"output"``: frame counts.
+        * ``"pending"``: frames rendered but not yet output.
+        * ``"render_ms"``, ``"output_ms"``, ``"latency_ms"``: dictionaries
+          of ``"p50"``, ``"p90"``, ``"p99"`` and ``"max"`` milliseconds
+          over recent frames, for rendering, writing to the sink, and from
+          the start of rendering to the end of writing.
+        * ``"backpressure_ms"``: total time rendering waited for the
+          output to free a buffer, and ``"backpressure_waits"``, how many
+          times it did.
+        * ``"starved_ms"``: total time the output waited for a frame.
+        """
+        return {
+            "rendered": self.rendered,
+            "output": self.output,
+            "pending": len(self._ready),
+            "render_ms": _percentiles(self._times["render"], self.rendered),
+            "output_ms": _percentiles(self._times["output"], self.output),
+            "latency_ms": _percentiles(self._times["latency"], self.output),
+            "backpressure_ms": self.render_wait * 1000.0,
+            "backpressure_waits": self.render_waits,
+            "starved_ms": self.output_wait * 1000.0,
+        }
@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.power`
+====================================================
+
+Power budgeting: estimate a strip's current draw from the frame being
+shown and scale brightness down to keep within a power supply's limit,
+as FastLED's setMaxPowerInMilliWatts() does. Kept out of the main
+FancyLED module so that projects not using it don't pay for it in RAM.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+from adafruit_fancyled.transform import ChannelTransform
+
+try:
+    from typing import Any, Union
+except ImportError:
+    pass
+
+
+class PowerBudget:
+    """Keep a strip's estimated current draw within a power supply's limit
+    by scaling brightness down when needed, as FastLED's
+    setMaxPowerInMilliWatts() does.
+
+    Draw is estimated from each channel's 8-bit level times a full-on
+    current per channel, plus an idle current per pixel. For a PixelFrame
+    created with 'track_power', the channel totals are kept up to date as
+    pixels are assigned, so the estimate costs no pass over the frame. The
+    scale is applied through a ChannelTransform's curves, i.e. in the same
+    lookup as gamma and brightness while packing:
+
+    .. code-block:: python
+
+          budget = PowerBudget(2000)  # 2 A supply
+          transform = ChannelTransform(2.5, 0.5)
+          frame = fancy.PixelFrame(300, track_power=True)
+          while True:
+              ...  # Draw into frame
+              fancy.pack_into(frame, buf, "GRB", gamma=transform, power=budget)
+              print(budget.stats["milliamps"])
+
+    The estimate applies the transform's brightness, correction and
+    temperature but not its gamma curve, so with gamma (which only ever
+    dims a channel's mid-levels) it errs on the safe side.
+
+    :param float max_milliamps: current the strip may draw.
+    :param float red: milliamps drawn by one pixel's red channel at full
+      level (default 16.0, FastLED's figure for WS2812 pixels).
+    :param float green: same for green (default 11.0).
+    :param float blue: same for blue (default 15.0).
+    :param float idle: milliamps drawn by each pixel when dark (default 1.0).
+    """
+
+    # Limit scales are rounded down to steps of 1/LIMIT_STEPS, so that a
+    # draw that varies a little from frame to frame doesn't rebuild a
+    # transform's curves every frame.
+    LIMIT_STEPS = 128
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        max_milliamps: float,
+        red: float = 16.0,
+        green: float = 11.0,
+        blue: float = 15.0,
+        idle: float = 1.0,
+    ) -> None:
+        self.max_milliamps = max_milliamps
+        self.red = red
+        self.green = green
+        self.blue = blue
+        self.idle = idle
+        self._transform = None  # Default ChannelTransform for pack_into()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Zero the frame counts and peak in `stats`."""
+        self.frames = 0
+        self.limited_frames = 0
+        self.milliamps = 0.0
+        self.limited_milliamps = 0.0
+        self.scale = 1.0
+        self.peak_milliamps = 0.0
+
+    def _draw(self, frame: Any, levels: Any, order: str) -> tuple[float, float]:
+        """Estimated (channel, idle) milliamps of a frame, with channels
+        scaled by 'levels'.
+        """
+        if isinstance(frame, fancy.PixelFrame):
+            red, green, blue = frame.channel_totals()
+            count = len(frame)
+        elif isinstance(frame, (bytes, bytearray, memoryview)):
+            bpp = len(order)
+            red = sum(frame[order.index("R") :: bpp])
+            green = sum(frame[order.index("G") :: bpp])
+            blue = sum(frame[order.index("B") :: bpp])
+            count = len(frame) // bpp
+        else:
+            red = green = blue = 0
+            for item in frame:
+                color = item if isinstance(item, int) else fancy._pack_rgb(*fancy._to_rgb(item))
+                red += (color >> 16) & 0xFF
+                green += (color >> 8) & 0xFF
+                blue += color & 0xFF
+            count = len(frame)
+        channels = (
+            red * self.red * levels[0]
+            + green * self.green * levels[1]
+            + blue * self.blue * levels[2]
+        ) / 255.0
+        return channels, self.idle * count
+
+    def _limit(self, frame: Any, levels: Any, order: str, steps: int = 0) -> float:
+        """Scale keeping the frame's draw within budget (rounded down to
+        1/'steps' if given), recording the frame's stats.
+        """
+        channels, idle = self._draw(frame, levels, order)
+        scale = 1.0
+        if channels + idle > self.max_milliamps and channels > 0.0:
+            scale = max(0.0, (self.max_milliamps - idle) / channels)
+            if steps:
+                scale = int(scale * steps) / steps
+            self.limited_frames += 1
+        self.frames += 1
+        self.milliamps = channels + idle
+        self.limited_milliamps = channels * scale + idle
+        self.scale = scale
+        self.peak_milliamps = max(self.peak_milliamps, self.milliamps)
+        return scale
+
+    def max_brightness(
+        self,
+        frame: Any,
+        brightness: Union[float, tuple[float, float, float]] = 1.0,
+        order: str = "RGB",
+    ) -> Union[float, tuple[float, float, float]]:
+        """Highest brightness, up to 'brightness', at which a frame keeps
+        within budget, e.g. to pass to gamma_adjust() or
+        palette_lookup_many() for the next frame.
+
+        :param frame: PixelFrame, pixel bytes in 'order', or sequence of
+          packed integers or colors (the latter two are counted in full).
+        :param brightness: single brightness or (R,G,B) tuple the frame
+          would be shown at.
+        :param str order: byte order of pixel bytes, as with pack_into().
+        """
+        levels = fancy._expand_rgb(brightness, 1.0)
+        scale = self._limit(frame, levels, order)
+        if isinstance(brightness, (int, float)):
+            return brightness * scale
+        return tuple(level * scale for level in levels)
+
+    def limit(self, frame: Any, transform: ChannelTransform, order: str = "RGB") -> float:
+        """Set a ChannelTransform's 'limit' so that 'frame', shown through
+        it, keeps within budget. pack_into() calls this when given 'power'.
+
+        :returns: the scale set.
+        """
+        transform.limit = self._limit(frame, transform.levels(), order, self.LIMIT_STEPS)
+        return transform.limit
+
+    def _prepare(self, frame: Any, gamma: Any, order: str) -> tuple:
+        """For pack_into(): the ChannelTransform to pack 'frame' through
+        ('gamma', or one without gamma correction if that's None), with its
+        limit set, and whether the limit changed.
+        """
+        if gamma is None:
+            if self._transform is None:
+                self._transform = ChannelTransform(1.0)
+            gamma = self._transform
+        elif not isinstance(gamma, ChannelTransform):
+            raise TypeError("power limiting needs a ChannelTransform as 'gamma'")
+        previous = gamma.limit
+        return gamma, self.limit(frame, gamma, order) != previous
+
+    @property
+    def stats(self) -> dict:
+        """Power statistics, as a dictionary of:
+
+        * ``"milliamps"``: last frame's estimated draw before limiting.
+        * ``"limited_milliamps"``: last frame's estimated draw after.
+        * ``"scale"``: last frame's limit scale (1.0 if not limited).
+        * ``"peak_milliamps"``: highest estimated draw before limiting.
+        * ``"frames"``: frames estimated.
+        * ``"limited_frames"``: frames that were scaled down.
+
+        Counts and peak are since creation or `reset_stats`.
+        """
+        return {
+            "milliamps": self.milliamps,
+            "limited_milliamps": self.limited_milliamps,
+            "scale": self.scale,
+            "peak_milliamps": self.peak_milliamps,
+            "frames": self.frames,
+            "limited_frames": self.limited_frames,
+        }
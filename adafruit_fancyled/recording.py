@@ -0,0 +1,278 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.recording`
+====================================================
+
+Pre-rendered animations: render a deterministic show (palette rotation,
+gradient sweep...) once into a file, then play it back for next to no
+CPU. Playback memory-maps the file, so each frame is a zero-copy
+memoryview slice of pixel bytes, ready to hand to a strip or a
+`adafruit_fancyled.netout` output.
+
+.. code-block:: python
+
+      def render(buf, elapsed):
+          fancy.palette_lookup_many(palette, buf, elapsed * 0.5, brightness=0.25)
+
+      record("spin.fled", render, 600, num_leds, fps=60)  # 10 seconds
+
+      with Player("spin.fled") as show:
+          while True:
+              frame = show.at(time.monotonic() - start)
+              ...
+
+File layout (little-endian): a 32-byte header, the unique frames' pixel
+bytes one after another, then a table of one 32-bit index per frame into
+those unique frames. A frame identical to the one before it (a static
+stretch of the show) is stored only once.
+
+Host-only (this uses mmap, which CircuitPython doesn't have); the main
+FancyLED module never imports this one.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+import mmap
+import struct
+import sys
+from array import array
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+
+try:
+    from typing import Any, Callable, Optional
+except ImportError:
+    pass
+
+MAGIC = b"FLED"
+VERSION = 1
+
+# Magic, version, bytes per pixel, order (4 bytes, NUL-padded), fps,
+# pixels per frame, frame count, unique frame count, table offset.
+_HEADER = struct.Struct("<4sHH4sfIIII")
+_DATA_START = 32  # Header size, rounded up
+
+
+class Recorder:
+    """Write frames to an animation file.
+
+    :param str path: file to create (overwritten if it exists).
+    :param int length: pixels per frame.
+    :param float fps: frame rate the animation plays back at.
+    :param str order: byte order of each pixel, as with pack_into()
+      ("RGB", "GRB", "RGBW"...).
+    :param bool dedupe: store a frame identical to the previous one only
+      once (default True).
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        path: str,
+        length: int,
+        fps: float = 30.0,
+        order: str = "RGB",
+        dedupe: bool = True,
+    ) -> None:
+        self.length = length
+        self.fps = fps
+        self.order = order
+        self.dedupe = dedupe
+        self.frame_bytes = len(order) * length
+        self._buf = bytearray(self.frame_bytes)
+        self._last = None  # Previous frame's bytes, for dedupe
+        self._table = array("I")  # Unique frame index of each frame
+        self._unique = 0
+        self._file = open(path, "wb")  # noqa: SIM115 -- closed by close()
+        self._file.write(bytes(_DATA_START))  # Header, written by close()
+
+    def add(self, frame: Any) -> None:
+        """Append a frame: bytes-like pixel data (already in 'order', at
+        least frame_bytes long) or anything pack_into() accepts.
+        """
+        if isinstance(frame, (bytes, bytearray, memoryview)):
+            data = bytes(frame[: self.frame_bytes])
+            if len(data) != self.frame_bytes:
+                raise ValueError("frame is too short")
+        else:
+            data = bytes(fancy.pack_into(frame, self._buf, self.order))
+        if not (self.dedupe and data == self._last):
+            self._file.write(data)
+            self._unique += 1
+            self._last = data
+        self._table.append(self._unique - 1)
+
+    def __len__(self) -> int:
+        """Number of frames added so far."""
+        return len(self._table)
+
+    def close(self) -> None:
+        """Write the frame table and header, and close the file."""
+        if self._file.closed:
+            return
+        table = self._table
+        if sys.byteorder != "little":
+            table = array("I", table)
+            table.byteswap()
+        offset = self._file.tell()
+        self._file.write(table.tobytes())
+        self._file.seek(0)
+        self._file.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                len(self.order),
+                self.order.encode("ascii"),
+                self.fps,
+                self.length,
+                len(self._table),
+                self._unique,
+                offset,
+            )
+        )
+        self._file.close()
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def record(  # noqa: PLR0913, PLR0917
+    path: str,
+    render: Callable[[bytearray, float], Any],
+    frames: int,
+    length: int,
+    fps: float = 30.0,
+    order: str = "RGB",
+) -> None:
+    """Render 'frames' frames into an animation file. 'render' is called
+    as ``render(buf, elapsed)`` for each frame, to fill 'buf' (a bytearray,
+    'order' bytes per pixel) with the frame 'elapsed' seconds into the
+    show -- e.g. with palette_lookup_many() or pack_into(). The same
+    buffer is reused for every frame.
+    """
+    with Recorder(path, length, fps, order) as recorder:
+        buf = bytearray(recorder.frame_bytes)
+        for i in range(frames):
+            render(buf, i / fps)
+            recorder.add(buf)
+
+
+class Player:
+    """Play back an animation file through a read-only memory map.
+
+    Frames are memoryview slices of the map: nothing is copied or
+    decoded to play a frame. They're only valid until `close`.
+
+    :param str path: animation file.
+    :param bool loop: whether times past the end wrap around to the start
+      (default True) or stay on the last frame.
+    """
+
+    def __init__(self, path: str, loop: bool = True) -> None:
+        self.loop = loop
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, bpp, order, fps, length, count, unique, offset) = _HEADER.unpack_from(
+            self._map
+        )
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError("not a FancyLED animation file")
+        self.order = order[:bpp].decode("ascii")
+        self.fps = fps
+        self.length = length  # Pixels per frame
+        self.frame_bytes = bpp * length
+        self.unique_frames = unique  # Frames actually stored
+        self._view = memoryview(self._map)
+        if sys.byteorder == "little":
+            self._table = self._view[offset : offset + 4 * count].cast("I")
+        else:
+            # array("I", view) would take each byte as a separate entry
+            self._table = array("I")
+            self._table.frombytes(self._view[offset : offset + 4 * count])
+            self._table.byteswap()
+        self.position = 0  # Index of the frame next_frame() returns
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Number of frames in the animation."""
+        return len(self._table)
+
+    @property
+    def duration(self) -> float:
+        """Length of the animation in seconds."""
+        return len(self._table) / self.fps
+
+    def frame(self, index: int) -> memoryview:
+        """Pixel bytes of frame 'index' (negative counts from the end)."""
+        if index < 0:
+            index += len(self._table)
+        start = _DATA_START + self._table[index] * self.frame_bytes
+        return self._view[start : start + self.frame_bytes]
+
+    def index_at(self, seconds: float) -> int:
+        """Index of the frame showing 'seconds' into the animation, wrapped
+        or clamped according to 'loop' (0 if there are no frames).
+        """
+        count = len(self._table)
+        if not count:
+            return 0
+        index = int(seconds * self.fps)
+        if self.loop:
+            return index % count
+        return 0 if index < 0 else min(index, count - 1)
+
+    def at(self, seconds: float) -> memoryview:
+        """Pixel bytes of the frame showing 'seconds' into the animation."""
+        return self.frame(self.index_at(seconds))
+
+    def seek(self, seconds: float) -> None:
+        """Make 'seconds' into the animation the next_frame() position."""
+        self.position = self.index_at(seconds)
+
+    def next_frame(self) -> Optional[memoryview]:
+        """Pixel bytes of the frame at the current position, advancing the
+        position. At the end, wraps around if looping, otherwise returns
+        None.
+        """
+        if self.position >= len(self._table):
+            if not self.loop or not self._table:
+                return None
+            self.position = 0
+        self.position += 1
+        return self.frame(self.position - 1)
+
+    def __iter__(self) -> Any:
+        """Every frame in order, once (whatever 'loop' is)."""
+        for index in range(len(self._table)):
+            yield self.frame(index)
+
+    def close(self) -> None:
+        """Unmap the file. If frames from this player are still referenced
+        (e.g. the last one of a ``for`` loop), the file stays mapped until
+        they're garbage-collected.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if isinstance(self._table, memoryview):
+                self._table.release()
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            pass  # Frames still pin the map; it's unmapped when they go
+
+    def __enter__(self) -> "Player":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.scheduler`
+====================================================
+
+Runs an animation's render function at a steady frame rate, on a clock,
+so that effects move at the same real-world speed whatever the board,
+strip length or effect complexity. Instead of stepping a palette offset
+by a fixed amount per loop, the render function is told how much time
+has passed:
+
+.. code-block:: python
+
+      from adafruit_fancyled.scheduler import FrameScheduler
+
+      def render(elapsed, dt):
+          fancy.palette_lookup_many(palette, colors, elapsed * 0.5)
+          pixels[:] = colors
+          pixels.show()
+
+      scheduler = FrameScheduler(render, fps=60)
+      scheduler.run()
+
+When rendering falls behind (a frame takes longer than its time slot),
+the missed slots are skipped rather than rendered late in a burst, and
+counted as dropped frames. `FrameScheduler.stats` reports the achieved
+frame rate, render time percentiles and dropped frames.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+import time
+from array import array
+
+try:
+    from typing import Any, Callable, Optional
+except ImportError:
+    pass
+
+
+class FrameScheduler:
+    """Call a render function at a target frame rate.
+
+    :param render: function called once per frame as ``render(elapsed, dt)``
+      with the seconds since the first frame and since the previous frame
+      (0.0 on the first frame). If it returns False, `run` stops.
+    :param float fps: target frames per second.
+    :param clock: function returning seconds as a float, default is
+      time.monotonic.
+    :param sleep: function sleeping for a number of seconds, default is
+      time.sleep.
+    :param int history: number of recent render times kept for the
+      percentiles in `stats`.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[float, float], Any],
+        fps: float = 30.0,
+        clock: Optional[Callable[[], float]] = None,
+        sleep: Optional[Callable[[float], Any]] = None,
+        history: int = 120,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.render = render
+        self.period = 1.0 / fps
+        self.clock = clock or time.monotonic
+        self.sleep = sleep or time.sleep
+        self._start = None  # Time of first frame
+        self._next = 0.0  # Deadline of next frame
+        self._last = 0.0  # Time of previous frame
+        self._running = False
+        # Render times (seconds), a ring buffer of the last 'history' frames
+        self._render_times = array("f", bytearray(4 * max(history, 1)))
+        self.reset_stats()
+
+    @property
+    def fps(self) -> float:
+        """Target frames per second."""
+        return 1.0 / self.period
+
+    @fps.setter
+    def fps(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError("fps must be positive")
+        self.period = 1.0 / value
+
+    def step(self) -> Any:
+        """Wait for the next frame's time slot and render it, skipping any
+        slots already missed.
+
+        :returns: whatever the render function returned.
+        """
+        clock = self.clock
+        now = clock()
+        if self._start is None:
+            self._start = self._last = self._next = now
+        elif now < self._next:
+            self.sleep(self._next - now)
+            now = clock()
+        late = now - self._next
+        if late >= self.period:
+            missed = int(late / self.period)
+            self.dropped += missed
+            self._next += missed * self.period
+
+        elapsed = now - self._start
+        dt = now - self._last
+        self._last = now
+        result = self.render(elapsed, dt)
+        render_time = clock() - now
+        self._next += self.period
+
+        times = self._render_times
+        times[self.frames % len(times)] = render_time
+        if not self.frames:
+            self._first_frame = now
+        self.frames += 1
+        self._last_frame = now
+        return result
+
+    def run(self, frames: Optional[int] = None, duration: Optional[float] = None) -> None:
+        """Render frames until `stop` is called, the render function returns
+        False, or (if given) 'frames' frames or 'duration' seconds have
+        passed.
+        """
+        self._running = True
+        end = None if duration is None else self.clock() + duration
+        count = 0
+        while self._running:
+            if self.step() is False:
+                break
+            count += 1
+            if (frames is not None and count >= frames) or (
+                end is not None and self.clock() >= end
+            ):
+                break
+        self._running = False
+
+    def stop(self) -> None:
+        """Make `run` return after the current frame."""
+        self._running = False
+
+    def reset_stats(self) -> None:
+        """Zero the frame, dropped-frame and render time statistics."""
+        self.frames = 0  # Frames rendered
+        self.dropped = 0  # Frame slots skipped because rendering fell behind
+        self._first_frame = self._last_frame = 0.0
+
+    @property
+    def stats(self) -> dict:
+        """Statistics since creation or `reset_stats`, as a dictionary of:
+
+        * ``"frames"``: frames rendered.
+        * ``"dropped"``: frame slots skipped.
+        * ``"fps"``: achieved frames per second (0.0 before two frames).
+        * ``"render_ms"``: dictionary of ``"p50"``, ``"p90"``, ``"p99"``
+          and ``"max"`` render times in milliseconds, over recent frames.
+        * ``"budget_ms"``: time available per frame in milliseconds.
+        """
+        span = self._last_frame - self._first_frame
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "fps": (self.frames - 1) / span if span > 0 else 0.0,
+            "render_ms": _percentiles(self._render_times, self.frames),
+            "budget_ms": self.period * 1000.0,
+        }
+
+
+def _percentiles(times: Any, total: int) -> dict:
+    """p50/p90/p99/max of a ring buffer of times in seconds (into which
+    'total' values have been written), in milliseconds.
+    """
+    count = min(total, len(times))
+    times = sorted(times[:count])
+    result = {}
+    for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0)):
+        result[name] = times[min(int(fraction * count), count - 1)] * 1000.0 if count else 0.0
+    return result
@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.transform`
+====================================================
+
+FastLED-style color correction and color temperature, fused with gamma
+correction and brightness into a single set of per-channel curves.
+Kept out of the main FancyLED module so that projects not using it don't
+pay for it in RAM.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+
+try:
+    from typing import Any, Optional, Union
+except ImportError:
+    pass
+
+
+class ChannelTransform:
+    """Gamma correction, brightness, color correction and color temperature
+    fused into one set of per-channel curves (a GammaTable), so all four
+    are applied in a single lookup per channel, e.g. while packing:
+
+    .. code-block:: python
+
+          transform = ChannelTransform(2.5, 0.5, correction=0xFFB0F0)
+          fancy.pack_into(frame, buf, "GRB", gamma=transform)
+          transform.brightness = 0.25  # Curves rebuilt on next use
+
+    Color correction and temperature work as in FastLED: per-channel
+    scales, given as colors (e.g. 0xFFB0F0 for typical LED strips, 0xFF9329
+    for candlelight; see the constants in `adafruit_fancyled.fastled_helpers`),
+    multiplied together with brightness. The curves are rebuilt, on next
+    use, only when a setting changes.
+
+    A ChannelTransform can be passed anywhere a GammaTable is accepted: as
+    'gamma_value' to gamma_adjust(), PixelFrame.gamma_adjust(),
+    palette_lookup_many() and fastled_helpers.applyGamma_video(), or as
+    'gamma' to pack_into().
+
+    :param gamma_value: single gamma-adjustment factor or (R,G,B) tuple,
+      default if unspecified is GFACTOR.
+    :param brightness: single brightness (0.0 to 1.0) or (R,G,B) tuple.
+    :param correction: color correction, a packed integer, CRGB or
+      (R,G,B) tuple of 0.0 to 1.0 scales (default is none, 0xFFFFFF).
+    :param temperature: color temperature, same form as 'correction'.
+    :param int size: number of curve steps, as with GammaTable.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        gamma_value: Optional[Union[float, tuple[float, float, float]]] = None,
+        brightness: Union[float, tuple[float, float, float]] = 1.0,
+        correction: Union[int, fancy.CRGB, tuple[float, float, float]] = 0xFFFFFF,
+        temperature: Union[int, fancy.CRGB, tuple[float, float, float]] = 0xFFFFFF,
+        size: int = 256,
+    ) -> None:
+        self._gamma = gamma_value
+        self._brightness = brightness
+        self._correction = correction
+        self._temperature = temperature
+        self._size = size
+        self._limit = 1.0
+        self._table = None
+
+    @property
+    def gamma(self) -> Any:
+        """Gamma-adjustment factor or (R,G,B) tuple."""
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, value: Any) -> None:
+        self._gamma = value
+        self._table = None
+
+    @property
+    def brightness(self) -> Any:
+        """Brightness (0.0 to 1.0) or (R,G,B) tuple."""
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value: Any) -> None:
+        self._brightness = value
+        self._table = None
+
+    @property
+    def correction(self) -> Any:
+        """Color correction, packed integer, CRGB or (R,G,B) tuple."""
+        return self._correction
+
+    @correction.setter
+    def correction(self, value: Any) -> None:
+        self._correction = value
+        self._table = None
+
+    @property
+    def temperature(self) -> Any:
+        """Color temperature, packed integer, CRGB or (R,G,B) tuple."""
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, value: Any) -> None:
+        self._temperature = value
+        self._table = None
+
+    @property
+    def limit(self) -> float:
+        """Extra brightness scale (0.0 to 1.0), as set by
+        `adafruit_fancyled.power.PowerBudget.limit` to keep within a power
+        budget. Unlike the other settings, assigning
+        the current value again doesn't rebuild the curves.
+        """
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: float) -> None:
+        if value != self._limit:
+            self._limit = value
+            self._table = None
+
+    def levels(self) -> tuple[float, float, float]:
+        """Per-channel output scales before the power limit: brightness,
+        correction and temperature multiplied together.
+        """
+        return tuple(
+            bright * corr * temp
+            for bright, corr, temp in zip(
+                fancy._expand_rgb(self._brightness, 1.0),
+                _channel_scales(self._correction),
+                _channel_scales(self._temperature),
+            )
+        )
+
+    @property
+    def table(self) -> fancy.GammaTable:
+        """The fused GammaTable, (re)built if settings have changed."""
+        if self._table is None:
+            levels = tuple(level * self._limit for level in self.levels())
+            self._table = fancy.GammaTable(self._gamma, levels, self._size)
+        return self._table
+
+    @property
+    def lut(self) -> bytearray:
+        """8-bit lookup table of the fused curves (see GammaTable.lut)."""
+        return self.table.lut
+
+    def adjust(self, color: Union[fancy.CRGB, fancy.CHSV, int]) -> fancy.CRGB:
+        """Transform a single CRGB, CHSV or packed integer color.
+
+        :returns: transformed CRGB color.
+        """
+        return self.table.adjust(color)
+
+    def apply(self, buf: Any, start: int = 0, stop: Optional[int] = None) -> None:
+        """Transform normalized R,G,B levels in-place, as with
+        GammaTable.apply().
+        """
+        self.table.apply(buf, start, stop)
+
+
+def _channel_scales(value: Any) -> tuple[float, float, float]:
+    """(R,G,B) scales from a correction/temperature color or tuple."""
+    if isinstance(value, tuple):
+        return value
+    return fancy._to_rgb(value)
@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_fancyled.vectorized`
+====================================================
+
+Optional NumPy backend for bulk FancyLED color math on host computers
+(rendering previews, preprocessing shows and so forth). Frames are NumPy
+arrays of shape (N, 3): floats in the normalized 0.0 to 1.0 range, or
+uint8 0 to 255 values (which are normalized on the way in). Each function
+gives the same results as its scalar counterpart in
+`adafruit_fancyled.adafruit_fancyled`, applied to every color.
+
+NumPy isn't available on CircuitPython, and the main FancyLED module never
+imports this one. This module also imports without NumPy, but its
+functions then raise RuntimeError -- check `AVAILABLE` first.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/Adafruit/Adafruit_CircuitPython_FancyLED.git"
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+from adafruit_fancyled import noise as _noise
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AVAILABLE = np is not None  # True if NumPy could be imported
+
+# normalize() of each 8-bit level
+_NORMALIZED = np.arange(256) / 255.0 if AVAILABLE else None
+
+
+def _require():
+    if np is None:
+        raise RuntimeError("NumPy is required for adafruit_fancyled.vectorized")
+
+
+def _as_float(colors):
+    """Float64 view/copy of 'colors', normalizing integer input."""
+    colors = np.asarray(colors)
+    if colors.dtype.kind in "ui":
+        return normalize(colors)
+    return colors.astype(np.float64, copy=False)
+
+
+def to_array(colors):
+    """Convert a list of CRGB, CHSV and/or packed integer colors, or a
+    PixelFrame, into an (N, 3) array of normalized floats.
+    """
+    _require()
+    if isinstance(colors, fancy.PixelFrame):
+        return np.array(colors.rgb, dtype=np.float64).reshape(-1, 3)
+    return np.array([fancy._to_rgb(c) for c in colors], dtype=np.float64).reshape(-1, 3)
+
+
+def frame_view(frame):
+    """Zero-copy (N, 3) float32 array view of a PixelFrame's storage.
+    Writing to the view modifies the frame.
+    """
+    _require()
+    return np.frombuffer(frame.rgb, dtype=np.float32).reshape(-1, 3)
+
+
+def normalize(values, out=None):
+    """Convert 8-bit (0 to 255) values to normalized (0.0 to 1.0) floats,
+    as with the scalar normalize() (input is clamped). uint8 input (e.g.
+    ``np.frombuffer()`` of pixel bytes) is converted through a lookup
+    table, with no temporary arrays when 'out' is given.
+
+    :param out: optional float array of the same shape for the result.
+    :returns: 'out', or a new float array.
+    """
+    _require()
+    values = np.asarray(values)
+    if values.dtype != np.uint8:
+        values = np.clip(values.astype(np.int64), 0, 255)
+    return np.take(_NORMALIZED, values, out=out)
+
+
+def denormalize(values, out=None):
+    """Convert normalized (0.0 to 1.0) floats to 8-bit (0 to 255) values,
+    as with the scalar denormalize().
+
+    :param out: optional uint8 array of the same shape for the result.
+    :returns: 'out', or a new uint8 array of the same shape.
+    """
+    _require()
+    result = np.clip(np.trunc(np.asarray(values, dtype=np.float64) * 256.0), 0, 255)
+    if out is None:
+        return result.astype(np.uint8)
+    out[...] = result
+    return out
+
+
+def gamma_adjust(colors, gamma_value=None, brightness=1.0):
+    """Gamma-correct an (N, 3) array of colors, as with gamma_adjust() on
+    a list of CRGB colors (gamma_value may also be a GammaTable).
+
+    :returns: new (N, 3) float array.
+    """
+    _require()
+    table = fancy._gamma_table(gamma_value, brightness)
+    colors = _as_float(colors)
+    size = table.size
+    result = np.empty(colors.shape, dtype=np.float64)
+    for channel in range(3):
+        if table.exact:
+            # No curves for gamma below 1.0; pow(), as the table itself does
+            result[..., channel] = (
+                np.power(colors[..., channel], table.gamma[channel]) * table.brightness[channel]
+            )
+            continue
+        curve = np.array((table.red, table.green, table.blue)[channel], dtype=np.float64)
+        pos = colors[..., channel] * size
+        idx = np.clip(pos, 0, size - 1).astype(np.int64)
+        low = curve[idx]
+        result[..., channel] = np.where(
+            pos >= size, curve[size], low + (curve[idx + 1] - low) * (pos - idx)
+        )
+    if not table._trusted:
+        np.clip(result, 0.0, 1.0, out=result)
+    return result
+
+
+def mix(colors1, colors2, weight2=0.5):
+    """Blend between two (N, 3) color arrays (or an array and a single
+    color row) using weighting (0.0 to 1.0) of the second, as with mix()
+    on RGB colors.
+
+    :returns: new (N, 3) float array.
+    """
+    _require()
+    weight2 = fancy.clamp(weight2, 0.0, 1.0)
+    weight1 = 1.0 - weight2
+    return _as_float(colors1) * weight1 + _as_float(colors2) * weight2
+
+
+def hsv_to_rgb(hsv):
+    """Convert an (N, 3) array of hue, saturation, value floats (as in
+    CHSV) to an (N, 3) array of RGB floats, as with CRGB(CHSV(...)).
+    """
+    _require()
+    hsv = np.asarray(hsv, dtype=np.float64)
+    hue = hsv[..., 0] * 6.0  # Hue circle = 0.0 to 6.0
+    sxt = np.floor(hue)  # Sextant index is next-lower integer of hue
+    frac = hue - sxt  # Fraction-within-sextant is 0.0 to <1.0
+    sxt = sxt.astype(np.int64) % 6  # mod6 the sextant so it's always 0 to 5
+    one = np.ones_like(frac)
+    zero = np.zeros_like(frac)
+    inv = 1.0 - frac
+    sextants = [sxt == n for n in range(5)]  # Anything else is sextant 5
+    red = np.select(sextants, [one, inv, zero, zero, frac], one)
+    green = np.select(sextants, [frac, one, one, inv, zero], zero)
+    blue = np.select(sextants, [zero, zero, frac, one, one], inv)
+    sat = hsv[..., 1]
+    val = hsv[..., 2]
+    invsat = 1.0 - sat  # Inverse-of-saturation
+    return np.stack(
+        (
+            ((red * sat) + invsat) * val,
+            ((green * sat) + invsat) * val,
+            ((blue * sat) + invsat) * val,
+        ),
+        axis=-1,
+    )
+
+
+def pack(colors):
+    """'Pack' an (N, 3) array of colors into 24-bit RGB integers a la
+    ``0x00RRGGBB``, as with CRGB.pack().
+
+    :returns: uint32 array of length N.
+    """
+    _require()
+    colors = np.asarray(colors)
+    if colors.dtype != np.uint8:
+        colors = denormalize(colors)
+    colors = colors.astype(np.uint32)
+    return (colors[..., 0] << 16) | (colors[..., 1] << 8) | colors[..., 2]
+
+
+def noise_field(width, height, x=0, y=0, z=None, scale=4096):  # noqa: PLR0913, PLR0917
+    """Grid of 8-bit noise values, the same as noise.noise_field() (see
+    there for the arguments). Like that function's bytearray, the result
+    can be passed directly as palette_lookup_many() 'positions'.
+
+    :returns: uint8 array of shape (height, width).
+    """
+    _require()
+    perm = np.frombuffer(_noise._PERMUTATION, dtype=np.uint8).astype(np.int64)
+    one = _noise._ONE
+    xs = x + np.arange(width, dtype=np.int64) * scale
+    ys = y + np.arange(height, dtype=np.int64) * scale
+    xs, ys = np.meshgrid(xs, ys)
+    zs = np.full_like(xs, 0 if z is None else z)
+    cx, cy, cz = ((c >> 16) & 0xFF for c in (xs, ys, zs))
+    fx, fy, fz = (c & 0xFFFF for c in (xs, ys, zs))
+    u, v, w = (((f * f) >> 16) * (3 * one - 2 * f) >> 16 for f in (fx, fy, fz))
+    fx1 = fx - one
+    fy1 = fy - one
+    a = perm[cx] + cy
+    b = perm[cx + 1] + cy
+
+    def grad(hash_, gx, gy, gz):
+        hash_ = hash_ & 15
+        gu = np.where(hash_ < 8, gx, gy)
+        gv = np.where(hash_ < 4, gy, np.where((hash_ == 12) | (hash_ == 14), gx, gz))
+        return np.where(hash_ & 1, -gu, gu) + np.where(hash_ & 2, -gv, gv)
+
+    def lerp(lo, hi, t):
+        return lo + (((hi - lo) * t) >> 16)
+
+    if z is None:
+        zero = np.zeros_like(fx)
+        raw = lerp(
+            lerp(grad(perm[a], fx, fy, zero), grad(perm[b], fx1, fy, zero), u),
+            lerp(grad(perm[a + 1], fx, fy1, zero), grad(perm[b + 1], fx1, fy1, zero), u),
+            v,
+        )
+    else:
+        fz1 = fz - one
+        aa, ab, ba, bb = perm[a] + cz, perm[a + 1] + cz, perm[b] + cz, perm[b + 1] + cz
+        raw = lerp(
+            lerp(
+                lerp(grad(perm[aa], fx, fy, fz), grad(perm[ba], fx1, fy, fz), u),
+                lerp(grad(perm[ab], fx, fy1, fz), grad(perm[bb], fx1, fy1, fz), u),
+                v,
+            ),
+            lerp(
+                lerp(grad(perm[aa + 1], fx, fy, fz1), grad(perm[ba + 1], fx1, fy, fz1), u),
+                lerp(grad(perm[ab + 1], fx, fy1, fz1), grad(perm[bb + 1], fx1, fy1, fz1), u),
+                v,
+            ),
+            w,
+        )
+    # Same scaling as noise._scale16(), then the top 8 bits
+    return (np.clip(32768 + ((raw * 3) >> 2), 0, 65535) >> 8).astype(np.uint8)
@@ -0,0 +1,335 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Micro-benchmarks for FancyLED's public color functions (host Python only).
+
+Times each function across realistic input shapes -- scalars, 60, 300,
+1,500 and 10,000 pixel frames, CRGB vs CHSV vs packed-integer input, and
+in-place vs copy -- and writes machine-readable JSON, so that two commits
+can be compared and regressions flagged:
+
+.. code-block:: shell
+
+    python benchmarks/fancyled_benchmarks.py --output baseline.json
+    # ...make changes...
+    python benchmarks/fancyled_benchmarks.py --compare baseline.json
+
+With --compare, any case more than --threshold (default 10%) slower than
+the baseline is reported and the exit status is 1. Timings are the best
+of several repeats, so compare results from the same machine only.
+
+In-place cases time a fresh copy of the input list plus the in-place
+call, since running in-place conversions repeatedly on the same list
+would change its contents.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from array import array
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import adafruit_fancyled.adafruit_fancyled as fancy
+import adafruit_fancyled.fastled_helpers as helper
+import adafruit_fancyled.fastled_int8 as int8
+
+SIZES = (60, 300, 1500, 10000)
+
+
+def _colors(kind, count):
+    """List of 'count' colors of one kind: 'crgb', 'chsv' or 'packed'."""
+    if kind == "crgb":
+        return [fancy.CRGB((i * 37) % 256, (i * 91) % 256, (i * 13) % 256) for i in range(count)]
+    if kind == "chsv":
+        return [fancy.CHSV(i / count, 0.75, 0.9) for i in range(count)]
+    return [(i * 0x3A5C7F) & 0xFFFFFF for i in range(count)]
+
+
+def _palettes():
+    return {
+        "crgb": _colors("crgb", 8),
+        "chsv": _colors("chsv", 8),
+        "packed": _colors("packed", 8),
+    }
+
+
+def build_cases(sizes=SIZES):  # noqa: PLR0914, PLR0915, too-many-locals, too-many-statements
+    """Return an ordered list of (name, items, callable) benchmark cases,
+    'items' being the number of colors/values processed per call.
+    """
+    cases = []
+
+    def add(name, items, func):
+        cases.append((name, items, func))
+
+    c1, c2 = fancy.CRGB(0.2, 0.4, 0.6), fancy.CRGB(0.9, 0.1, 0.3)
+    h1, h2 = fancy.CHSV(0.2, 0.8, 0.9), fancy.CHSV(0.7, 0.5, 1.0)
+    p1, p2 = 0x336699, 0xE61A4D
+
+    # Constructors, packing and scalar helpers
+    add("CRGB(float)", 1, lambda: fancy.CRGB(0.2, 0.4, 0.6))
+    add("CRGB(int)", 1, lambda: fancy.CRGB(51, 102, 153))
+    add("CRGB(CHSV)", 1, lambda: fancy.CRGB(h1))
+    add("CRGB.from_normalized", 1, lambda: fancy.CRGB.from_normalized(0.2, 0.4, 0.6))
+    add("CHSV(float)", 1, lambda: fancy.CHSV(0.2, 0.8, 0.9))
+    add("CRGB.pack", 1, c1.pack)
+    add("CRGB.pack(white)", 1, lambda: c1.pack(0.5))
+    add("CHSV.pack", 1, h1.pack)
+    add("unpack", 1, lambda: fancy.unpack(p1))
+    add("clamp", 1, lambda: fancy.clamp(1.5, 0.0, 1.0))
+    add("clamp_norm", 1, lambda: fancy.clamp_norm(128))
+    add("normalize(int)", 1, lambda: fancy.normalize(128))
+    add("denormalize(float)", 1, lambda: fancy.denormalize(0.5))
+
+    # mix() across input type combinations
+    add("mix(CRGB,CRGB)", 1, lambda: fancy.mix(c1, c2, 0.3))
+    add("mix(CHSV,CHSV)", 1, lambda: fancy.mix(h1, h2, 0.3))
+    add("mix(CHSV,CRGB)", 1, lambda: fancy.mix(h1, c2, 0.3))
+    add("mix(packed,packed)", 1, lambda: fancy.mix(p1, p2, 0.3))
+
+    # Single-value gamma
+    add("gamma_adjust(float)", 1, lambda: fancy.gamma_adjust(0.5))
+    add("gamma_adjust(CRGB)", 1, lambda: fancy.gamma_adjust(c1, brightness=0.5))
+    add("gamma_adjust(CHSV)", 1, lambda: fancy.gamma_adjust(h1, brightness=0.5))
+    add(
+        "gamma_adjust(CRGB,rgb tuples)",
+        1,
+        lambda: fancy.gamma_adjust(c1, (2.2, 2.5, 2.7), (0.25, 0.3, 0.15)),
+    )
+
+    # Palette lookups
+    for kind, pal in _palettes().items():
+        add(f"palette_lookup({kind} palette)", 1, lambda pal=pal: fancy.palette_lookup(pal, 0.37))
+    compiled = fancy.Palette(_palettes()["crgb"])
+    tabled = fancy.Palette(_palettes()["crgb"], steps=256)
+    gradient = [(i / 7, color) for i, color in enumerate(_palettes()["packed"])]
+    gradient_pal = fancy.GradientPalette(gradient)
+    add("Palette.lookup", 1, lambda: compiled.lookup(0.37))
+    add("Palette.lookup(table)", 1, lambda: tabled.lookup(0.37))
+    add("Palette.lookup_u8(table)", 1, lambda: tabled.lookup_u8(95))
+    add("GradientPalette.lookup", 1, lambda: gradient_pal.lookup(0.37))
+
+    # fastled_helpers wrappers
+    helper_pal = helper.loadDynamicGradientPalette(
+        bytes([0, 255, 255, 255, 64, 255, 255, 0, 128, 255, 0, 0, 255, 0, 0, 0]), 16
+    )
+    add("helper.ColorFromPalette", 1, lambda: helper.ColorFromPalette(helper_pal, 40, 128, True))
+    add("helper.applyGamma_video(CRGB)", 1, lambda: helper.applyGamma_video(c1))
+    add("helper.hsv2rgb_spectrum", 1, lambda: helper.hsv2rgb_spectrum(40, 200, 255))
+    add(
+        "helper.loadDynamicGradientPalette(16)",
+        16,
+        lambda: helper.loadDynamicGradientPalette(
+            bytes([0, 255, 255, 255, 64, 255, 255, 0, 128, 255, 0, 0, 255, 0, 0, 0]), 16
+        ),
+    )
+    int8_pal = bytes(range(48))
+    add("int8.ColorFromPalette", 1, lambda: int8.ColorFromPalette(int8_pal, 40, 128, True))
+    add("int8.hsv2rgb_rainbow", 1, lambda: int8.hsv2rgb_rainbow(40, 200, 128))
+
+    # Whole-frame operations at each size
+    for size in sizes:
+        floats = [(i % 256) / 255.0 for i in range(size)]
+        ints = [i % 256 for i in range(size)]
+        frame_colors = {kind: _colors(kind, size) for kind in ("crgb", "chsv", "packed")}
+
+        add(f"normalize(list)[{size}]", size, lambda v=ints: fancy.normalize(v))
+        add(f"normalize(list,inplace)[{size}]", size, lambda v=ints: fancy.normalize(v[:], True))
+        add(f"denormalize(list)[{size}]", size, lambda v=floats: fancy.denormalize(v))
+        add(
+            f"denormalize(list,inplace)[{size}]",
+            size,
+            lambda v=floats: fancy.denormalize(v[:], True),
+        )
+        add(f"gamma_adjust(floats)[{size}]", size, lambda v=floats: fancy.gamma_adjust(v))
+        for kind in ("crgb", "chsv"):
+            colors = frame_colors[kind]
+            add(
+                f"gamma_adjust({kind} list)[{size}]",
+                size,
+                lambda v=colors: fancy.gamma_adjust(v, brightness=0.5),
+            )
+            add(
+                f"gamma_adjust({kind} list,inplace)[{size}]",
+                size,
+                lambda v=colors: fancy.gamma_adjust(v[:], brightness=0.5, inplace=True),
+            )
+            add(
+                f"helper.applyGamma_video({kind} list)[{size}]",
+                size,
+                lambda v=colors: helper.applyGamma_video(v),
+            )
+        for kind, colors in frame_colors.items():
+            add(
+                f"pack loop({kind})[{size}]",
+                size,
+                lambda v=colors: [c if isinstance(c, int) else c.pack() for c in v],
+            )
+            add(
+                f"pack_into({kind},GRB)[{size}]",
+                size,
+                lambda v=colors, b=bytearray(3 * size): fancy.pack_into(v, b, "GRB"),
+            )
+        crgb = frame_colors["crgb"]
+        add(
+            f"palette_lookup loop[{size}]",
+            size,
+            lambda n=size, p=_palettes()["crgb"]: [
+                fancy.palette_lookup(p, i / n) for i in range(n)
+            ],
+        )
+        out = array("I", bytes(4 * size))
+        add(
+            f"palette_lookup_many[{size}]",
+            size,
+            lambda o=out: fancy.palette_lookup_many(compiled, o, 0.1),
+        )
+        add(
+            f"palette_lookup_many(gamma)[{size}]",
+            size,
+            lambda o=out: fancy.palette_lookup_many(compiled, o, 0.1, brightness=0.25),
+        )
+        add(f"expand_gradient[{size}]", size, lambda n=size: fancy.expand_gradient(gradient, n))
+        add(
+            f"expand_gradient(out)[{size}]",
+            size,
+            lambda n=size, o=out: fancy.expand_gradient(gradient, n, o),
+        )
+        add(f"fill_rainbow[{size}]", size, lambda o=out: fancy.fill_rainbow(o, 0.1))
+        add(
+            f"hsv_to_rgb_many[{size}]",
+            size,
+            lambda v=frame_colors["chsv"], o=out: fancy.hsv_to_rgb_many(v, o),
+        )
+
+        frame = fancy.PixelFrame(size)
+        for i, color in enumerate(crgb):
+            frame[i] = color
+        other = fancy.PixelFrame(size, 0x204060)
+        add(f"PixelFrame.fill[{size}]", size, lambda f=frame: f.fill(0x102030))
+        add(f"PixelFrame.mix(frame)[{size}]", size, lambda f=frame, o=other: f.mix(o, 0.1))
+        add(f"PixelFrame.gamma_adjust[{size}]", size, lambda f=frame: f.gamma_adjust(1.0))
+        add(f"PixelFrame.pack[{size}]", size, lambda f=frame, o=out: f.pack(o))
+        add(
+            f"pack_into(PixelFrame,GRB)[{size}]",
+            size,
+            lambda f=frame, b=bytearray(3 * size): fancy.pack_into(f, b, "GRB"),
+        )
+
+        rgb_bytes = bytearray(ints * 3)
+        add(
+            f"int8.nscale8(bytes)[{size}]",
+            size,
+            lambda b=rgb_bytes: int8.nscale8(b, 255),
+        )
+
+    return cases
+
+
+def time_case(func, min_time=0.05, repeat=5):
+    """Best-of-'repeat' seconds per call, each repeat running for at least
+    'min_time' seconds.
+    """
+    number = 1
+    while True:  # Calibrate loop count
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed * 1.2))
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run(name_filter=None, sizes=SIZES, min_time=0.05, repeat=5, verbose=True):
+    """Run (matching) cases, returning the JSON-ready result document."""
+    results = {}
+    for name, items, func in build_cases(sizes):
+        if name_filter and name_filter not in name:
+            continue
+        seconds = time_case(func, min_time, repeat)
+        results[name] = {"seconds": seconds, "items": items, "per_item": seconds / items}
+        if verbose:
+            print(f"{name:48s} {seconds * 1e6:12.2f} us {seconds / items * 1e9:10.1f} ns/item")
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "min_time": min_time,
+            "repeat": repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=0.10):
+    """Compare two result documents. Returns a list of (name, baseline
+    seconds, current seconds, ratio) for cases slower than the baseline by
+    more than 'threshold' (a fraction).
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if not before:
+            continue
+        ratio = result["seconds"] / before["seconds"]
+        if ratio > 1.0 + threshold:
+            regressions.append((name, before["seconds"], result["seconds"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", "-o", help="write JSON results to this file")
+    parser.add_argument("--compare", "-c", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="slowdown fraction flagged (default 0.10)"
+    )
+    parser.add_argument("--filter", "-k", help="only run cases whose name contains this")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma-separated frame sizes (default %(default)s)",
+    )
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per repeat")
+    parser.add_argument("--repeat", type=int, default=5, help="repeats per case (best is kept)")
+    parser.add_argument("--quiet", "-q", action="store_true", help="no per-case output")
+    args = parser.parse_args(argv)
+
+    sizes = tuple(int(size) for size in args.sizes.split(",") if size)
+    document = run(args.filter, sizes, args.min_time, args.repeat, not args.quiet)
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(document, out, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as src:
+            baseline = json.load(src)
+        regressions = compare(document, baseline, args.threshold)
+        for name, before, after, ratio in regressions:
+            print(
+                f"REGRESSION {name}: {before * 1e6:.2f} us -> {after * 1e6:.2f} us ({ratio:.2f}x)"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
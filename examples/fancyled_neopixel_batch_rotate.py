@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""FancyLED example for NeoPixel strip, rendering the whole strip per call"""
+
+import board
+import neopixel
+
+import adafruit_fancyled.adafruit_fancyled as fancy
+
+num_leds = 300
+
+# Declare a 6-element RGB rainbow palette, compiled once up front so the
+# colors aren't re-converted on every lookup.
+palette = fancy.Palette(
+    [
+        fancy.CRGB(1.0, 0.0, 0.0),  # Red
+        fancy.CRGB(0.5, 0.5, 0.0),  # Yellow
+        fancy.CRGB(0.0, 1.0, 0.0),  # Green
+        fancy.CRGB(0.0, 0.5, 0.5),  # Cyan
+        fancy.CRGB(0.0, 0.0, 1.0),  # Blue
+        fancy.CRGB(0.5, 0.0, 0.5),  # Magenta
+    ]
+)
+
+# Declare a NeoPixel object on pin D6 with num_leds pixels, no auto-write.
+# Set brightness to max because we'll be using FancyLED's brightness control.
+pixels = neopixel.NeoPixel(board.D6, num_leds, brightness=1.0, auto_write=False)
+colors = [0] * num_leds  # Packed colors for one frame, reused every frame
+
+offset = 0  # Positional offset into color palette to get it to 'spin'
+
+while True:
+    # Look up, gamma-correct and pack every pixel's color in one call,
+    # then hand the whole frame to the strip.
+    fancy.palette_lookup_many(palette, colors, offset, brightness=0.25)
+    pixels[:] = colors
+    pixels.show()
+
+    offset += 0.02  # Bigger number = faster spin
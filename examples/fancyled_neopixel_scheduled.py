@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""FancyLED example for NeoPixel strip, animating at a fixed frame rate"""
+
+import board
+import neopixel
+
+import adafruit_fancyled.adafruit_fancyled as fancy
+from adafruit_fancyled.scheduler import FrameScheduler
+
+num_leds = 300
+
+# Declare a 6-element RGB rainbow palette
+palette = fancy.Palette(
+    [
+        fancy.CRGB(1.0, 0.0, 0.0),  # Red
+        fancy.CRGB(0.5, 0.5, 0.0),  # Yellow
+        fancy.CRGB(0.0, 1.0, 0.0),  # Green
+        fancy.CRGB(0.0, 0.5, 0.5),  # Cyan
+        fancy.CRGB(0.0, 0.0, 1.0),  # Blue
+        fancy.CRGB(0.5, 0.0, 0.5),  # Magenta
+    ]
+)
+
+# Declare a NeoPixel object on pin D6 with num_leds pixels, no auto-write.
+# Set brightness to max because we'll be using FancyLED's brightness control.
+pixels = neopixel.NeoPixel(board.D6, num_leds, brightness=1.0, auto_write=False)
+colors = [0] * num_leds  # Packed colors for one frame, reused every frame
+
+SPEED = 0.6  # Palette rotations per second, whatever the frame rate
+
+
+def render(elapsed, dt):
+    # The palette offset comes from the elapsed time, not a frame count,
+    # so the spin speed doesn't depend on how fast the board is.
+    fancy.palette_lookup_many(palette, colors, elapsed * SPEED, brightness=0.25)
+    pixels[:] = colors
+    pixels.show()
+
+
+scheduler = FrameScheduler(render, fps=50)
+while True:
+    scheduler.run(duration=10)
+    print(scheduler.stats)  # Achieved fps, render times, dropped frames
+    scheduler.reset_stats()
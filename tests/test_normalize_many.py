@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+
+
+def test_bytes_match_normalize():
+    data = bytes(range(256))
+    expected = array("f", fancy.normalize(list(data)))
+    assert fancy.normalize_many(data) == expected
+    assert fancy.normalize_many(memoryview(data)) == expected
+    out = array("f", bytearray(4 * 256))
+    assert fancy.normalize_many(bytearray(data), out) is out
+    assert out == expected
+
+
+def test_wider_buffers_are_clamped():
+    values = [-300, -1, 0, 128, 255, 256, 1000]
+    expected = fancy.normalize(values)
+    for typecode in ("h", "i"):
+        data = array(typecode, values)
+        assert list(fancy.normalize_many(memoryview(data), [0.0] * 7)) == expected
+        assert list(fancy.normalize_many(data, [0.0] * 7)) == expected
+    signed = array("b", [-128, -1, 0, 127])
+    assert list(fancy.normalize_many(memoryview(signed), [0.0] * 4)) == fancy.normalize(
+        list(signed)
+    )
+
+
+def test_denormalize_round_trip():
+    data = bytes(range(256))
+    assert bytes(fancy.denormalize_many(fancy.normalize_many(data))) == data
@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+
+import pytest
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+from adafruit_fancyled import noise, vectorized
+
+PALETTE = [0xFF0000, 0xFFFF00, 0x00FF00, 0x0000FF]
+WIDTH, HEIGHT = 16, 8
+
+
+def _render(positions, offset=0.1):
+    out = bytearray(3 * WIDTH * HEIGHT)
+    return bytes(fancy.palette_lookup_many(PALETTE, out, offset, positions=positions))
+
+
+def _reference(field):
+    """Render from the same positions as floats, 1/256 turn per step."""
+    return _render([value / 256.0 for value in field])
+
+
+def test_byte_buffers_are_8bit_positions():
+    field = noise.noise_field(WIDTH, HEIGHT, 0, 0, 0x18000, 8192)
+    expected = _reference(field)
+    assert _render(field) == expected
+    assert _render(bytes(field)) == expected
+    assert _render(memoryview(field)) == expected
+    assert _render(array("B", field)) == expected
+
+
+def test_other_buffers_are_float_positions():
+    floats = array("d", [i / (WIDTH * HEIGHT) for i in range(WIDTH * HEIGHT)])
+    expected = _render(list(floats))
+    assert _render(floats) == expected
+    assert _render(memoryview(floats)) == expected
+    assert _render(memoryview(floats).cast("B").cast("d")) == expected
+
+
+@pytest.mark.skipif(not vectorized.AVAILABLE, reason="needs NumPy")
+def test_numpy_noise_field():
+    field = vectorized.noise_field(WIDTH, HEIGHT, 0, 0, 0x18000, 8192)
+    expected = _reference(noise.noise_field(WIDTH, HEIGHT, 0, 0, 0x18000, 8192))
+    assert _render(field) == expected
+    assert _render(field.ravel()) == expected
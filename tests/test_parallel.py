@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+
+import pytest
+
+from adafruit_fancyled import adafruit_fancyled as fancy
+from adafruit_fancyled import noise
+
+parallel = pytest.importorskip("adafruit_fancyled.parallel")
+
+PALETTE = [0xFF0000, 0xFFFF00, 0x00FF00, 0x0000FF]
+LENGTH = 301  # Not a multiple of the segment count
+
+
+def _single(offset, step=None, positions=None, **options):
+    out = bytearray(3 * LENGTH)
+    return bytes(fancy.palette_lookup_many(PALETTE, out, offset, step, positions, **options))
+
+
+def _parallel(offset, step=None, positions=None, **options):
+    with parallel.ParallelRenderer(
+        PALETTE, LENGTH, workers=2, segments=3, positions=positions, **options
+    ) as renderer:
+        return bytes(renderer.render(offset, step))
+
+
+@pytest.mark.parametrize(
+    "positions",
+    [
+        None,
+        [i * 0.0137 for i in range(LENGTH)],
+        array("f", [i * 0.0137 for i in range(LENGTH)]),
+        noise.noise_field(LENGTH, 1, 0, 0, 0x18000, 8192),  # 8-bit bytearray
+    ],
+    ids=["step", "list", "array", "noise_field"],
+)
+def test_matches_single_process(positions):
+    expected = _single(0.25, positions=positions, brightness=0.5)
+    assert _parallel(0.25, positions=positions, brightness=0.5) == expected
+
+
+def test_noise_field_uses_8bit_positions():
+    field = noise.noise_field(LENGTH, 1, 0, 0, 0x18000, 8192)
+    rendered = _parallel(0.0, positions=field)
+    assert rendered == _single(0.0, positions=[value / 256.0 for value in field])